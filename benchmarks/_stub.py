@@ -0,0 +1,81 @@
+"""Minimal stand-in for the BitBrowser local API used by the benchmarks."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Optional
+
+Handler = Callable[[str, dict], Any]
+
+
+class StubServer:
+    """Serve ``{"success": true, "data": handler(path, payload)}`` over HTTP/1.1.
+
+    ``latency`` adds a fixed delay per request to mimic the real service.
+    Counts connections, requests and response bytes so benchmarks can report
+    socket churn and transfer.
+    """
+
+    def __init__(self, handler: Optional[Handler] = None, *, latency: float = 0.0):
+        self.handler = handler or (lambda path, payload: {})
+        self.latency = latency
+        self.connections = 0
+        self.requests = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        stub = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self) -> None:
+                super().setup()
+                with stub._lock:
+                    stub.connections += 1
+
+            def do_POST(self) -> None:  # noqa: N802
+                length = int(self.headers.get("Content-Length") or 0)
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                if stub.latency:
+                    time.sleep(stub.latency)
+                body = json.dumps(
+                    {"success": True, "data": stub.handler(self.path, payload)}
+                ).encode()
+                with stub._lock:
+                    stub.requests += 1
+                    stub.bytes_sent += len(body)
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        class _Server(ThreadingHTTPServer):
+            # The default listen backlog of 5 drops connects under load.
+            request_queue_size = 128
+
+        self.server = _Server(("127.0.0.1", 0), _Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def reset_counters(self) -> None:
+        with self._lock:
+            self.connections = 0
+            self.requests = 0
+            self.bytes_sent = 0
+
+    def __enter__(self) -> StubServer:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,105 @@
+"""Micro-benchmark of request payload serialization.
+
+For every request model in ``bit_browser.models.misc`` and
+``bit_browser.models.browser`` compares:
+
+- ``model_dump``: build the model and dump it with ``model_dump`` (old path)
+- ``dict``: ``build_payload`` without a model (what convenience methods use)
+
+Run from the repo root::
+
+    PYTHONPATH=src python benchmarks/bench_payload.py
+"""
+
+from __future__ import annotations
+
+import inspect
+import timeit
+from typing import Any
+
+from bit_browser._compat import build_payload, model_dump
+from bit_browser.models import browser, misc
+from bit_browser.models.base import APIModel
+
+NUMBER = 20_000
+
+SAMPLES: dict[str, dict[str, Any]] = {
+    # bit_browser.models.browser
+    "BrowserUpdateRequest": {
+        "name": "profile",
+        "remark": "r",
+        "proxyMethod": 2,
+        "proxyType": "noproxy",
+        "browserFingerPrint": {"coreVersion": "112"},
+    },
+    "BrowserPartialUpdateRequest": {"ids": ["a", "b"], "browserFingerPrint": {}},
+    # bit_browser.models.misc
+    "BrowserIdsRequest": {"ids": ["a", "b", "c"]},
+    "BrowserIdRequest": {"id": "a"},
+    "CloseBySeqsRequest": {"seqs": [1, 2, 3]},
+    "WindowBoundsFlexibleRequest": {"seqlist": [1, 2, 3]},
+    "WindowBoundsRequest": {
+        "type": "box",
+        "startX": 0,
+        "startY": 0,
+        "width": 800,
+        "height": 600,
+        "col": 3,
+        "spaceX": 0,
+        "spaceY": 0,
+        "seqlist": [1, 2, 3],
+    },
+    "ProxyUpdateRequest": {
+        "ids": ["a"],
+        "ipCheckService": "ip-api",
+        "proxyMethod": 2,
+        "proxyType": "http",
+        "host": "127.0.0.1",
+        "port": 8080,
+    },
+    "UpdateRemarkRequest": {"browserIds": ["a", "b"], "remark": "r"},
+    "CheckAgentRequest": {"host": "127.0.0.1", "port": "8080", "proxyType": "http"},
+    "BrowserOpenRequest": {"id": "a", "args": ["--mute-audio"]},
+    "AutopasteRequest": {"browserId": "a", "url": "https://example.com"},
+    "ReadFileRequest": {"filepath": "/tmp/data.txt"},
+    "CookiesSetRequest": {
+        "browserId": "a",
+        "cookies": [{"name": "n", "value": "v", "domain": ".example.com"}],
+    },
+    "CookiesClearRequest": {"browserId": "a", "saveSynced": True},
+    "CookiesFormatRequest": {"cookie": "n=v", "hostname": "example.com"},
+    "RpaRequest": {"id": "task"},
+}
+
+
+def request_models() -> list[type[APIModel]]:
+    models = []
+    for module in (browser, misc):
+        for name, obj in vars(module).items():
+            if (
+                inspect.isclass(obj)
+                and issubclass(obj, APIModel)
+                and obj.__module__ == module.__name__
+                and name.endswith("Request")
+            ):
+                models.append(obj)
+    return models
+
+
+def main() -> None:
+    models = request_models()
+    missing = [m.__name__ for m in models if m.__name__ not in SAMPLES]
+    if missing:
+        raise SystemExit(f"no sample payload for: {', '.join(missing)}")
+
+    print(f"{'model':<30} {'model_dump':>11} {'dict':>9}  (us/call)")
+    for model in models:
+        fields = SAMPLES[model.__name__]
+        old = timeit.timeit(lambda: model_dump(model(**fields)), number=NUMBER)
+        fast = timeit.timeit(lambda: build_payload(model, **fields), number=NUMBER)
+        scale = 1e6 / NUMBER
+        print(f"{model.__name__:<30} {old * scale:>11.2f} {fast * scale:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Throughput of a shared BrowserClient as the number of worker threads grows.
+
+Compares requests' default pool (10 connections), a pool sized to the thread
+count, and per-thread sessions against a local stub of the BitBrowser API.
+
+Run from the repo root::
+
+    PYTHONPATH=src python benchmarks/bench_pool.py
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from _stub import StubServer
+
+from bit_browser.clients import BrowserClient
+
+THREADS = (1, 4, 16, 64)
+CALLS_PER_THREAD = 50
+LATENCY = 0.002
+
+
+def run(stub: StubServer, threads: int, **options: object) -> str:
+    # Identical concurrent reads would share one request; measure the pool.
+    client = BrowserClient(url=stub.url, coalesce_reads=False, **options)
+    stub.reset_counters()
+
+    def worker(_: int) -> None:
+        for _ in range(CALLS_PER_THREAD):
+            client.get_all_pids()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(worker, range(threads)))
+    rate = threads * CALLS_PER_THREAD / (time.perf_counter() - start)
+    return f"{rate:>7.0f}/{stub.connections:<4}"
+
+
+def main() -> None:
+    with StubServer(latency=LATENCY) as stub:
+        print(f"{'threads':>8} {'default':>12} {'sized pool':>12} {'per-thread':>12}  (req/s / sockets)")
+        for threads in THREADS:
+            default = run(stub, threads)
+            sized = run(stub, threads, pool_maxsize=threads)
+            local = run(stub, threads, per_thread_session=True)
+            print(f"{threads:>8} {default:>12} {sized:>12} {local:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Filter pushdown vs. fetching every profile and filtering in Python.
+
+A local stub of ``/browser/list`` holds synthetic profiles and applies the
+server-supported filters (``groupId``, fuzzy ``name``/``remark``,
+``minSeq``/``maxSeq``). Each query is run with and without pushdown and the
+bytes transferred, request count and wall time are reported.
+
+Run from the repo root::
+
+    PYTHONPATH=src python benchmarks/bench_query.py
+"""
+
+from __future__ import annotations
+
+import time
+
+from _stub import StubServer
+
+from bit_browser.clients import BrowserClient
+from bit_browser.clients.query import ProfileFilter, query_browsers
+
+PROFILES = 5_000
+PAGE_SIZE = 100
+LATENCY = 0.001
+
+QUERIES = {
+    "group": ProfileFilter(group_id="g3"),
+    "name substring": ProfileFilter(name="shop-1"),
+    "seq range + proxy": ProfileFilter(min_seq=1000, max_seq=1500, proxy_host="10.0.0.7"),
+    "group + remark": ProfileFilter(group_id="g1", remark="vip"),
+}
+
+
+def make_profiles() -> list[dict]:
+    return [
+        {
+            "id": f"id-{i:05d}",
+            "seq": i,
+            "name": f"shop-{i}",
+            "remark": "vip customer" if i % 7 == 0 else "regular",
+            "groupId": f"g{i % 10}",
+            "proxyMethod": 2,
+            "proxyType": "http",
+            "host": f"10.0.0.{i % 16}",
+            "port": 8000 + i % 100,
+            "browserFingerPrint": {"coreVersion": "112", "ostype": "PC", "os": "Win32"},
+        }
+        for i in range(PROFILES)
+    ]
+
+
+def list_handler(profiles: list[dict]):
+    def handle(path: str, payload: dict) -> dict:
+        rows = profiles
+        if "groupId" in payload:
+            rows = [p for p in rows if p["groupId"] == payload["groupId"]]
+        for field in ("name", "remark"):
+            if field in payload:
+                needle = payload[field].lower()
+                rows = [p for p in rows if needle in p[field].lower()]
+        if "minSeq" in payload:
+            rows = [p for p in rows if p["seq"] >= payload["minSeq"]]
+        if "maxSeq" in payload:
+            rows = [p for p in rows if p["seq"] <= payload["maxSeq"]]
+        page, size = payload["page"], payload["pageSize"]
+        return {"totalNum": len(rows), "list": rows[page * size : (page + 1) * size]}
+
+    return handle
+
+
+def run(stub: StubServer, client: BrowserClient, flt: ProfileFilter, pushdown: bool) -> tuple[int, int, int, float]:
+    stub.reset_counters()
+    start = time.perf_counter()
+    found = sum(1 for _ in query_browsers(client, flt, page_size=PAGE_SIZE, pushdown=pushdown))
+    return found, stub.requests, stub.bytes_sent, time.perf_counter() - start
+
+
+def main() -> None:
+    with StubServer(list_handler(make_profiles()), latency=LATENCY) as stub:
+        client = BrowserClient(url=stub.url)
+        print(f"{'query':<20} {'mode':<10} {'matches':>7} {'requests':>8} {'KiB':>9} {'ms':>8}")
+        for label, flt in QUERIES.items():
+            for pushdown in (False, True):
+                found, requests, sent, elapsed = run(stub, client, flt, pushdown)
+                mode = "pushdown" if pushdown else "fetch-all"
+                print(f"{label:<20} {mode:<10} {found:>7} {requests:>8} {sent / 1024:>9.1f} {elapsed * 1000:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,10 @@ from typing import Any, Type, TypeVar
 
 from pydantic import BaseModel
 
+from bit_browser import constants
+
 T = TypeVar("T")
+M = TypeVar("M", bound=BaseModel)
 
 
 def to_camel(string: str) -> str:
@@ -24,6 +27,13 @@ def model_validate(model: Type[T], obj: Any) -> T:
     return model.parse_obj(obj)  # type: ignore[attr-defined]
 
 
+def field_names(model: Type[BaseModel]) -> frozenset[str]:
+    fields = getattr(model, "model_fields", None)
+    if fields is None:  # Pydantic v1
+        fields = model.__fields__  # type: ignore[attr-defined]
+    return frozenset(fields)
+
+
 def model_dump(
     instance: BaseModel, *, by_alias: bool = True, exclude_none: bool = True
 ) -> dict[str, Any]:
@@ -31,3 +41,17 @@ def model_dump(
     if callable(md):
         return md(by_alias=by_alias, exclude_none=exclude_none)  # type: ignore[misc]
     return instance.dict(by_alias=by_alias, exclude_none=exclude_none)  # type: ignore[call-arg]
+
+
+def build_payload(model: Type[M], **fields: Any) -> dict[str, Any]:
+    """Build a request payload for ``model`` without instantiating it.
+
+    ``None`` values are dropped, as ``model_dump(exclude_none=True)`` would.
+    Callers must pass every field the model would otherwise default. With
+    ``BITBROWSER_DEBUG`` set, the payload is validated and dumped through the
+    model instead, so mistakes surface as validation errors.
+    """
+    payload = {k: v for k, v in fields.items() if v is not None}
+    if constants.DEBUG:
+        return model_dump(model_validate(model, payload))
+    return payload
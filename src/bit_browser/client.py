@@ -1,26 +1,36 @@
 from __future__ import annotations
 
-from typing import Optional
+import threading
+from typing import Any, Optional
 
 from bit_browser.clients.browser import BrowserClient
 
 _client: Optional[BrowserClient] = None
+_lock = threading.Lock()
 
 
-def get_client(token: Optional[str] = None) -> BrowserClient:
+def get_client(token: Optional[str] = None, **options: Any) -> BrowserClient:
     """Return a lazily-instantiated, shared :class:`BrowserClient`.
 
-    The client is created on first call. Pass ``token`` on the first call to
-    authenticate; subsequent calls return the same instance regardless of the
-    argument. Use :func:`reset_client` to force a new instance.
+    The client is created on first call. Pass ``token`` and any
+    :class:`BrowserClient` keyword options (``pool_maxsize``, ``keep_alive``,
+    ``per_thread_session``, ...) on the first call; subsequent calls return
+    the same instance regardless of the arguments. Creation is guarded by a
+    lock, so concurrent first calls from several threads build one client.
+    Use :func:`reset_client` to force a new instance.
     """
     global _client
-    if _client is None:
-        _client = BrowserClient(token=token)
-    return _client
+    client = _client
+    if client is None:
+        with _lock:
+            if _client is None:
+                _client = BrowserClient(token=token, **options)
+            client = _client
+    return client
 
 
 def reset_client() -> None:
     """Discard the cached client so the next :func:`get_client` rebuilds it."""
     global _client
-    _client = None
+    with _lock:
+        _client = None
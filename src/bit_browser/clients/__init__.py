@@ -1,3 +1,26 @@
+from .attach import AttachResult, open_and_attach
+from .batch import Batch
 from .browser import BrowserClient
+from .extralog import ExtralogStore
+from .groups import GroupIndex
+from .layout import WindowLayoutPlanner
+from .provision import ProvisionStats, provision_profiles
+from .query import ProfileFilter, query_browsers
+from .rpa import RpaScheduler
+from .sharded import ShardedClient
 
-__all__ = ["BrowserClient"]
+__all__ = [
+    "AttachResult",
+    "Batch",
+    "BrowserClient",
+    "ExtralogStore",
+    "GroupIndex",
+    "ProfileFilter",
+    "ProvisionStats",
+    "RpaScheduler",
+    "ShardedClient",
+    "WindowLayoutPlanner",
+    "open_and_attach",
+    "provision_profiles",
+    "query_browsers",
+]
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Sequence
+
+import requests
+
+from bit_browser.clients.timeouts import Deadline
+from bit_browser.errors import DeadlineExceededError
+from bit_browser.models.browser import BrowserOpenData
+
+if TYPE_CHECKING:
+    from bit_browser.clients.browser import BrowserClient
+
+DEFAULT_DEADLINE = 60.0
+
+
+@dataclass
+class AttachResult:
+    """Outcome of opening one profile and waiting for its DevTools endpoint."""
+
+    browser_id: str
+    open_data: Optional[BrowserOpenData] = None
+    version: Optional[dict[str, Any]] = None
+    error: Optional[BaseException] = None
+    elapsed: float = 0.0
+
+    @property
+    def ready(self) -> bool:
+        return self.error is None and self.version is not None
+
+    @property
+    def ws(self) -> Optional[str]:
+        """Browser-level WebSocket URL, as reported by ``/json/version``."""
+        if self.version and self.version.get("webSocketDebuggerUrl"):
+            return self.version["webSocketDebuggerUrl"]
+        return self.open_data.ws if self.open_data else None
+
+
+def wait_for_devtools(
+    http: str,
+    *,
+    deadline: float,
+    initial_delay: float = 0.05,
+    max_delay: float = 1.0,
+    probe_timeout: float = 2.0,
+    session: Optional[requests.Session] = None,
+) -> dict[str, Any]:
+    """Poll ``http://<http>/json/version`` until it answers or ``deadline``.
+
+    ``deadline`` is a ``time.monotonic()`` timestamp. The delay between
+    probes doubles from ``initial_delay`` up to ``max_delay``. Raises
+    :class:`DeadlineExceededError` with the last probe error when time runs
+    out.
+    """
+    base = http if http.startswith(("http://", "https://")) else f"http://{http}"
+    url = f"{base.rstrip('/')}/json/version"
+    get = session.get if session is not None else requests.get
+    delay = initial_delay
+    last_error: Optional[BaseException] = None
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceededError(f"DevTools endpoint {url} not ready: {last_error}")
+        try:
+            response = get(url, timeout=min(probe_timeout, remaining))
+            if response.ok:
+                return response.json()
+            last_error = RuntimeError(f"HTTP {response.status_code}")
+        except (requests.RequestException, ValueError) as e:
+            last_error = e
+        time.sleep(max(0.0, min(delay, deadline - time.monotonic())))
+        delay = min(delay * 2, max_delay)
+
+
+def open_and_attach(
+    client: BrowserClient,
+    browser_ids: Sequence[str],
+    *,
+    max_workers: Optional[int] = None,
+    deadline: float = DEFAULT_DEADLINE,
+    args: Optional[list[str]] = None,
+    queue: Optional[bool] = None,
+    **probe_options: Any,
+) -> Iterator[AttachResult]:
+    """Open profiles concurrently and yield each one as soon as it's attachable.
+
+    Each profile gets ``deadline`` seconds, counted from when its open
+    request starts, to open and answer ``/json/version``; an enclosing
+    :class:`Deadline` shortens that further. Results arrive in
+    completion order; failures (open errors or timeouts) are yielded with
+    ``error`` set rather than raised, so one bad profile doesn't stop the
+    stream. Extra keyword arguments are passed to :func:`wait_for_devtools`.
+
+    Example::
+
+        for result in open_and_attach(client, ids, max_workers=16):
+            if result.ready:
+                connect(result.ws)
+    """
+
+    def run(browser_id: str) -> AttachResult:
+        start = time.monotonic()
+        result = AttachResult(browser_id=browser_id)
+        try:
+            request: dict[str, Any] = {"id": browser_id}
+            if args is not None:
+                request["args"] = args
+            if queue is not None:
+                request["queue"] = queue
+            with Deadline(deadline) as budget:
+                result.open_data = client.browser_open_typed(request)
+                result.version = wait_for_devtools(
+                    result.open_data.http, deadline=budget.at, **probe_options
+                )
+        except Exception as e:
+            result.error = e
+        result.elapsed = time.monotonic() - start
+        return result
+
+    workers = max_workers or getattr(client, "pool_maxsize", None) or len(browser_ids) or 1
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bitbrowser-attach")
+    try:
+        futures = [
+            pool.submit(contextvars.copy_context().run, run, browser_id)
+            for browser_id in browser_ids
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        # Stop opening further profiles if the caller stops iterating early.
+        pool.shutdown(wait=False, cancel_futures=True)
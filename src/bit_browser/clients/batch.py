@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import contextvars
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from bit_browser.clients.timeouts import Deadline
+
+if TYPE_CHECKING:
+    from bit_browser.clients.browser import BrowserClient
+
+# Fallback when the client doesn't expose its pool size.
+DEFAULT_MAX_WORKERS = 10
+
+
+class Batch:
+    """Run :class:`BrowserClient` calls concurrently and collect futures.
+
+    Any public client method called on a batch is submitted to a thread pool
+    and returns a :class:`concurrent.futures.Future` instead of its result::
+
+        with client.batch(max_workers=16) as b:
+            details = [b.browser_detail_typed({"id": i}) for i in ids]
+            pids = b.get_all_pids()
+            groups = b.group_list_typed(page=0, page_size=100)
+
+        profiles = [f.result() for f in details]
+
+    Leaving the ``with`` block waits for every submitted call. Errors are not
+    raised on exit; they surface per future through ``Future.result()``.
+    """
+
+    def __init__(
+        self,
+        client: BrowserClient,
+        max_workers: Optional[int] = None,
+        *,
+        deadline: Optional[float] = None,
+    ):
+        """
+        Args:
+            client (BrowserClient): Client whose methods are dispatched.
+            max_workers (Optional[int], optional): Thread count. Defaults to
+                the client's ``pool_maxsize``, so a batch doesn't open more
+                sockets than the session keeps alive.
+            deadline (Optional[float], optional): Seconds the whole batch may
+                take; every call shares this budget. Defaults to None.
+        """
+        self.client = client
+        self.max_workers = max_workers or getattr(client, "pool_maxsize", DEFAULT_MAX_WORKERS)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="bitbrowser-batch"
+        )
+        self._futures: list[Future] = []
+        self.deadline = Deadline(deadline) if deadline is not None else None
+
+    def __enter__(self) -> Batch:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        # If the block itself failed, don't start calls that haven't run yet.
+        self.close(cancel_pending=exc_type is not None)
+
+    def __getattr__(self, name: str) -> Callable[..., Future]:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        attr = getattr(self.client, name)
+        if not callable(attr):
+            raise AttributeError(f"{type(self.client).__name__}.{name} is not callable")
+
+        def submit(*args: Any, **kwargs: Any) -> Future:
+            return self.submit(attr, *args, **kwargs)
+
+        submit.__name__ = name
+        submit.__doc__ = attr.__doc__
+        return submit
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """Schedule an arbitrary callable alongside the client calls.
+
+        The call runs in a copy of the caller's context, so an active
+        :class:`Deadline` still applies inside the pool.
+        """
+        ctx = contextvars.copy_context()
+        if self.deadline is not None:
+            future = self._executor.submit(ctx.run, self._run_with_deadline, fn, *args, **kwargs)
+        else:
+            future = self._executor.submit(ctx.run, fn, *args, **kwargs)
+        self._futures.append(future)
+        return future
+
+    def _run_with_deadline(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        with Deadline(self.deadline.remaining()):  # type: ignore[union-attr]
+            return fn(*args, **kwargs)
+
+    @property
+    def futures(self) -> list[Future]:
+        """Futures in submission order."""
+        return list(self._futures)
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """Block until every submitted call has finished (or ``timeout``)."""
+        wait(self._futures, timeout=timeout)
+
+    def results(self, *, return_exceptions: bool = False) -> list[Any]:
+        """Wait and return results in submission order.
+
+        With ``return_exceptions=True`` failed calls yield their exception
+        instead of raising the first one encountered.
+        """
+        out: list[Any] = []
+        for future in self._futures:
+            if return_exceptions:
+                if future.cancelled():
+                    out.append(CancelledError())
+                    continue
+                exc = future.exception()
+                out.append(exc if exc is not None else future.result())
+            else:
+                out.append(future.result())
+        return out
+
+    def close(self, *, cancel_pending: bool = False) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=cancel_pending)
@@ -1,18 +1,27 @@
 from __future__ import annotations
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional, Sequence, TypeVar
 
 import requests
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
 
+from bit_browser.clients.batch import Batch
+from bit_browser.clients.singleflight import READ_ONLY_ENDPOINTS, SingleFlight, request_key
+from bit_browser.clients.timeouts import TimeoutPolicy, current_deadline
 from bit_browser.constants import HEADERS, URL
 from bit_browser.errors import (
     APIError,
+    BitBrowserError,
+    DeadlineExceededError,
     HTTPStatusError,
     NetworkError,
     ResponseDecodeError,
     ResponseValidationError,
 )
-from bit_browser._compat import model_dump, model_validate
+from bit_browser._compat import build_payload, model_dump, model_validate
 from bit_browser.models.base import APIResponse
 from bit_browser.models.browser import (
     BrowserListData,
@@ -48,9 +57,35 @@ from bit_browser.models.misc import (
 
 T = TypeVar("T")
 
+DEFAULT_POOL_CONNECTIONS = DEFAULT_POOLSIZE
+DEFAULT_POOL_MAXSIZE = DEFAULT_POOLSIZE
+
+# Sentinel: pick the timeout from the client's TimeoutPolicy.
+AUTO: Any = object()
+
+# Cheap read used as a liveness probe.
+PING_ENDPOINT = "/browser/ports"
+DEFAULT_PING_TIMEOUT = 1.0
+DEFAULT_HEALTH_TTL = 2.0
+
 
 class BrowserClient:
-    def __init__(self, url=URL, headers=HEADERS, token: Optional[str] = None):
+    def __init__(
+        self,
+        url=URL,
+        headers=HEADERS,
+        token: Optional[str] = None,
+        *,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = DEFAULT_POOLBLOCK,
+        keep_alive: bool = True,
+        per_thread_session: bool = False,
+        timeout_policy: Optional[TimeoutPolicy] = None,
+        coalesce_reads: bool = True,
+        fail_fast: bool = True,
+        health_ttl: float = DEFAULT_HEALTH_TTL,
+    ):
         """
         Initialize the BrowserClient with optional API token.
 
@@ -58,26 +93,130 @@ class BrowserClient:
             url (str, optional): URL Defaults to URL.
             headers (dict, optional): Headers Defaults to HEADERS.
             token (Optional[str], optional): Token Defaults to None.
+            pool_connections (int, optional): Number of host pools kept by the
+                HTTP adapter. Defaults to DEFAULT_POOL_CONNECTIONS.
+            pool_maxsize (int, optional): Keep-alive connections kept per host.
+                Size this to the number of threads sharing the client.
+                Defaults to DEFAULT_POOL_MAXSIZE.
+            pool_block (bool, optional): Block when every pooled connection is
+                busy instead of opening a throwaway one. Defaults to
+                DEFAULT_POOLBLOCK.
+            keep_alive (bool, optional): Reuse connections between requests.
+                Defaults to True.
+            per_thread_session (bool, optional): Give each thread its own
+                ``requests.Session`` instead of sharing one. Defaults to False.
+            timeout_policy (Optional[TimeoutPolicy], optional): Per-endpoint
+                timeouts. Defaults to TimeoutPolicy().
+            coalesce_reads (bool, optional): Share one in-flight request
+                between threads making the same read-only call without an
+                explicit timeout or active Deadline. Defaults to True.
+            fail_fast (bool, optional): Raise ``NetworkError`` immediately
+                while the service is known to be unreachable; once that
+                expires, one thread pings it before calls resume. Defaults
+                to True.
+            health_ttl (float, optional): Seconds a liveness result is
+                trusted. Defaults to DEFAULT_HEALTH_TTL.
         """
         self.token = token
         self.url = url
         self.headers = headers.copy()
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
-        self.session.headers.update({"x-api-key": token}) if token else None
+        self.headers.update({"x-api-key": token}) if token else None
+        if not keep_alive:
+            self.headers["Connection"] = "close"
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.per_thread_session = per_thread_session
+        self.timeout_policy = timeout_policy or TimeoutPolicy()
+        self.coalesce_reads = coalesce_reads
+        self._singleflight = SingleFlight()
+        self.fail_fast = fail_fast
+        self.health_ttl = health_ttl
+        # (up, when): True/False from a request or ping, None when a ping
+        # after a failure was inconclusive.
+        self._health: Optional[tuple[Optional[bool], float]] = None
+        self._probe_lock = threading.Lock()
+        self._local = threading.local()
+        self._shared_session = None if per_thread_session else self._new_session()
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        """The session used by the calling thread."""
+        if self._shared_session is not None:
+            return self._shared_session
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self._new_session()
+        return session
+
+    @session.setter
+    def session(self, session: requests.Session) -> None:
+        self._shared_session = session
 
     def _post(
         self,
         endpoint: str,
         payload: dict | None = None,
         *,
-        timeout: float | None = 10.0,
+        timeout: float | None = AUTO,
+    ) -> Any:
+        # Calls bounded by their own timeout or deadline aren't shared, so
+        # one caller's limit can't fail another's request.
+        if (
+            self.coalesce_reads
+            and endpoint in READ_ONLY_ENDPOINTS
+            and timeout is AUTO
+            and current_deadline() is None
+        ):
+            return self._singleflight.do(
+                request_key(endpoint, payload),
+                lambda: self._send(endpoint, payload, timeout),
+            )
+        return self._send(endpoint, payload, timeout)
+
+    def _send(
+        self,
+        endpoint: str,
+        payload: dict | None,
+        timeout: float | None,
+        *,
+        probe: bool = False,
     ) -> Any:
+        if self.fail_fast and not probe and self._probe_health() is False:
+            raise NetworkError(f"BitBrowser service at {self.url} is unreachable")
         url = f"{self.url}{endpoint}"
+        from_policy = timeout is AUTO
+        if from_policy:
+            timeout = self.timeout_policy.timeout_for(endpoint)
+        deadline = current_deadline()
+        if deadline is not None:
+            timeout = deadline.cap(timeout)
+        start = time.monotonic()
         try:
             response = self.session.post(url, json=(payload or {}), timeout=timeout)
         except requests.RequestException as e:  # pragma: no cover
+            if isinstance(e, requests.ConnectionError):
+                self._health = (False, time.monotonic())
+            if deadline is not None and deadline.expired:
+                raise DeadlineExceededError(str(e)) from e
+            if from_policy and isinstance(e, requests.Timeout):
+                self.timeout_policy.observe_timeout(endpoint)
             raise NetworkError(str(e)) from e
+        self._health = (True, time.monotonic())
+        self.timeout_policy.observe(endpoint, time.monotonic() - start)
 
         if not response.ok:
             raise HTTPStatusError(response.status_code, response.text)
@@ -92,13 +231,95 @@ class BrowserClient:
             raise APIError(api.msg, data=api.data)
         return api.data
 
+    # --- Health ---
+    def cached_health(self) -> Optional[bool]:
+        """Last known liveness if newer than ``health_ttl``, else None."""
+        health = self._health
+        if health is None or time.monotonic() - health[1] > self.health_ttl:
+            return None
+        return health[0]
+
+    def _probe_health(self) -> Optional[bool]:
+        # Health only matters once a connection has failed: a client that
+        # has never failed, or last succeeded, never pings. After a failure
+        # expires, one thread pings while the others wait for its answer.
+        if not self._last_failed():
+            return None
+        with self._probe_lock:
+            if self._last_failed() and self.cached_health() is None:
+                self.ping(force=True)
+                if self.cached_health() is None:
+                    # Inconclusive (e.g. the ping timed out): record that, so
+                    # waiting threads go ahead instead of pinging in turn.
+                    self._health = (None, time.monotonic())
+        return self.cached_health()
+
+    def _last_failed(self) -> bool:
+        health = self._health
+        return health is not None and health[0] is False
+
+    def ping(self, *, force: bool = False, timeout: float = DEFAULT_PING_TIMEOUT) -> bool:
+        """Return whether the local service answers.
+
+        Uses the cached result (from a previous ping or any real request)
+        unless it is older than ``health_ttl`` or ``force`` is set.
+        """
+        if not force:
+            cached = self.cached_health()
+            if cached is not None:
+                return cached
+        try:
+            self._send(PING_ENDPOINT, None, timeout, probe=True)
+        except NetworkError:
+            return False
+        except BitBrowserError:
+            pass  # it answered, just not with success
+        return True
+
+    def prewarm(self, n: int = DEFAULT_POOL_MAXSIZE, *, timeout: float = DEFAULT_PING_TIMEOUT) -> int:
+        """Open up to ``n`` keep-alive connections before a burst of calls.
+
+        Each connection is established with a liveness request and returned
+        to the pool, so the next ``n`` concurrent calls skip TCP setup. ``n``
+        is capped at ``pool_maxsize``. With ``per_thread_session`` only the
+        calling thread's session is warmed. Returns the number opened.
+        """
+        n = min(n, self.pool_maxsize)
+        if n <= 0:
+            return 0
+        session = self.session
+        url = f"{self.url}{PING_ENDPOINT}"
+
+        def open_one(_: int) -> requests.Response:
+            # stream=True holds the connection until the body is read, so
+            # every concurrent request gets its own socket.
+            return session.post(url, json={}, timeout=timeout, stream=True)
+
+        responses: list[requests.Response] = []
+        with ThreadPoolExecutor(max_workers=n) as executor:
+            for future in [executor.submit(open_one, i) for i in range(n)]:
+                try:
+                    responses.append(future.result())
+                except requests.RequestException:
+                    continue
+        # Only release once every request is out, then hand the sockets back.
+        for response in responses:
+            # Reading the body marks it consumed, so close() hands the socket
+            # back to the pool instead of closing it.
+            _ = response.content
+            response.close()
+        opened = len(responses)
+        if opened:
+            self._health = (True, time.monotonic())
+        return opened
+
     def _post_typed(
         self,
         endpoint: str,
         payload: dict | None,
         model: type[T],
         *,
-        timeout: float | None = 10.0,
+        timeout: float | None = AUTO,
     ) -> T:
         data = self._post(endpoint, payload, timeout=timeout)
         try:
@@ -114,6 +335,15 @@ class BrowserClient:
             return obj
         return model_dump(obj, by_alias=True, exclude_none=True)
 
+    def batch(
+        self, max_workers: Optional[int] = None, *, deadline: Optional[float] = None
+    ) -> Batch:
+        """Return a :class:`Batch` that runs this client's calls concurrently.
+
+        Use as a context manager; every method called on it returns a future.
+        """
+        return Batch(self, max_workers=max_workers, deadline=deadline)
+
     # --- Browser Profiles ---
     def browser_update(self, request: BrowserUpdateRequest | dict[str, Any]) -> Any:
         return self._post("/browser/update", self._payload(request))
@@ -269,58 +499,59 @@ class BrowserClient:
         if request is not None:
             payload = self._payload(request)
         else:
-            payload = self._payload(
-                WindowBoundsRequest(
-                    type=type,
-                    startX=startX,
-                    startY=startY,
-                    width=width,
-                    height=height,
-                    col=col,
-                    spaceX=spaceX,
-                    spaceY=spaceY,
-                    offsetX=offsetX,
-                    offsetY=offsetY,
-                    seqlist=list(seqlist) if seqlist is not None else None,
-                    screenId=screenId,
-                )
+            payload = build_payload(
+                WindowBoundsRequest,
+                type=type,
+                startX=startX,
+                startY=startY,
+                width=width,
+                height=height,
+                col=col,
+                spaceX=spaceX,
+                spaceY=spaceY,
+                offsetX=offsetX,
+                offsetY=offsetY,
+                seqlist=list(seqlist) if seqlist is not None else None,
+                screenId=screenId,
             )
         payload.update(extra)
         return self._post("/windowbounds", payload)
 
     def windowbounds_flexible(self, seqlist: Sequence[int] | None = None) -> Any:
-        req = WindowBoundsFlexibleRequest(seqlist=list(seqlist) if seqlist is not None else None)
-        return self._post("/windowbounds/flexable", self._payload(req))
+        payload = build_payload(
+            WindowBoundsFlexibleRequest, seqlist=list(seqlist) if seqlist is not None else None
+        )
+        return self._post("/windowbounds/flexable", payload)
 
     def get_all_displays(self) -> Any:
         return self._post("/alldisplays")
 
     def rpa_run(self, task_id: str) -> Any:
-        return self._post("/rpa/run", self._payload(RpaRequest(id=task_id)))
+        return self._post("/rpa/run", build_payload(RpaRequest, id=task_id))
 
     def rpa_stop(self, task_id: str) -> Any:
-        return self._post("/rpa/stop", self._payload(RpaRequest(id=task_id)))
+        return self._post("/rpa/stop", build_payload(RpaRequest, id=task_id))
 
     def autopaste(self, browser_id: str, url: str) -> Any:
-        return self._post("/autopaste", self._payload(AutopasteRequest(browserId=browser_id, url=url)))
+        return self._post("/autopaste", build_payload(AutopasteRequest, browserId=browser_id, url=url))
 
     def utils_read_excel(self, filepath: str) -> Any:
-        return self._post("/utils/readexcel", self._payload(ReadFileRequest(filepath=filepath)))
+        return self._post("/utils/readexcel", build_payload(ReadFileRequest, filepath=filepath))
 
     def utils_read_file(self, filepath: str) -> Any:
-        return self._post("/utils/readfile", self._payload(ReadFileRequest(filepath=filepath)))
+        return self._post("/utils/readfile", build_payload(ReadFileRequest, filepath=filepath))
 
     def cookies_set(self, browser_id: str, cookies: list[dict]) -> Any:
-        return self._post("/browser/cookies/set", self._payload(CookiesSetRequest(browserId=browser_id, cookies=cookies)))
+        return self._post("/browser/cookies/set", build_payload(CookiesSetRequest, browserId=browser_id, cookies=list(cookies)))
 
     def cookies_get(self, browser_id: str) -> Any:
         return self._post("/browser/cookies/get", {"browserId": browser_id})
 
     def cookies_clear(self, browser_id: str, save_synced: bool = True) -> Any:
-        return self._post("/browser/cookies/clear", self._payload(CookiesClearRequest(browserId=browser_id, saveSynced=save_synced)))
+        return self._post("/browser/cookies/clear", build_payload(CookiesClearRequest, browserId=browser_id, saveSynced=save_synced))
 
     def cookies_format(self, cookie: str | list[dict], hostname: str | None = None) -> Any:
-        return self._post("/browser/cookies/format", self._payload(CookiesFormatRequest(cookie=cookie, hostname=hostname)))
+        return self._post("/browser/cookies/format", build_payload(CookiesFormatRequest, cookie=cookie, hostname=hostname))
 
     def fingerprint_random(self, browser_id: str) -> Any:
         return self._post("/browser/fingerprint/random", {"browserId": browser_id})
@@ -341,10 +572,10 @@ class BrowserClient:
         return self._post("/browser/pids", {"ids": list(ids)})
 
     def delete_browsers_by_ids(self, ids: list[str]) -> Any:
-        return self._post("/browser/delete/ids", self._payload(BrowserIdsRequest(ids=ids)))
+        return self._post("/browser/delete/ids", build_payload(BrowserIdsRequest, ids=list(ids)))
 
     def close_by_seqs(self, seqs: Sequence[int]) -> Any:
-        return self._post("/browser/close/byseqs", self._payload(CloseBySeqsRequest(seqs=list(seqs))))
+        return self._post("/browser/close/byseqs", build_payload(CloseBySeqsRequest, seqs=list(seqs)))
 
     def close_all(self) -> Any:
         return self._post("/browser/close/all")
@@ -447,7 +678,7 @@ class BrowserClient:
         return self._post("/browser/proxy/update", self._payload(request))
 
     def update_remark(self, browser_ids: Sequence[str], remark: str) -> Any:
-        return self._post("/browser/remark/update", self._payload(UpdateRemarkRequest(browserIds=list(browser_ids), remark=remark)))
+        return self._post("/browser/remark/update", build_payload(UpdateRemarkRequest, browserIds=list(browser_ids), remark=remark))
 
     def check_agent(
         self,
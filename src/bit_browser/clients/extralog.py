@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from bit_browser.errors import BitBrowserError
+from bit_browser.models.extralog import ExtralogItem
+
+if TYPE_CHECKING:
+    from bit_browser.clients.browser import BrowserClient
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class ExtralogStore:
+    """Client-side view of ``/extralog/*`` with write-behind and a local index.
+
+    - ``add``/``update`` return immediately; a background thread sends them
+      in order. ``flush()`` blocks until everything queued so far is sent.
+    - ``get``/``get_by_key`` read through a cache of :class:`ExtralogItem`
+      by ``id`` and ``log_key``.
+    - ``find`` answers ``log_type``/``log_key`` lookups from a local index
+      filled by ``load()`` and by every item the store sees.
+
+    Pending writes are flushed by ``close()``, and otherwise when the store
+    is garbage collected or at interpreter exit, whichever comes first.
+    """
+
+    def __init__(self, client: BrowserClient, *, page_size: int = 100):
+        """
+        Args:
+            client (BrowserClient): Client used to reach the service.
+            page_size (int, optional): Page size used by ``load``. Defaults
+                to 100.
+        """
+        self.client = client
+        self.page_size = page_size
+        self._lock = threading.RLock()
+        self._by_id: dict[int, ExtralogItem] = {}
+        self._by_key: dict[str, ExtralogItem] = {}
+        self._by_type: dict[str, set[str]] = {}
+        self._errors: list[BaseException] = []
+        self._queue: queue.Queue = queue.Queue()
+        self._closed = False
+        # The writer holds no strong reference to the store, so an unclosed
+        # store can still be collected; the finalizer then flushes it.
+        self._worker = threading.Thread(
+            target=_write_loop,
+            args=(self._queue, client, self._errors, weakref.WeakMethod(self._saved)),
+            name="bitbrowser-extralog",
+            daemon=True,
+        )
+        self._worker.start()
+        self._finalizer = weakref.finalize(
+            self, _finalize, self._queue, self._worker, self._errors
+        )
+
+    def __enter__(self) -> ExtralogStore:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    # --- Index ---
+    def _index(self, item: ExtralogItem) -> None:
+        with self._lock:
+            if item.id is not None:
+                self._by_id[item.id] = item
+            if item.log_key is not None:
+                previous = self._by_key.get(item.log_key)
+                if previous is not None and previous.log_type is not None:
+                    self._by_type.get(previous.log_type, set()).discard(item.log_key)
+                self._by_key[item.log_key] = item
+                if item.log_type is not None:
+                    self._by_type.setdefault(item.log_type, set()).add(item.log_key)
+
+    def _unindex(self, item: ExtralogItem) -> None:
+        with self._lock:
+            if item.id is not None:
+                self._by_id.pop(item.id, None)
+            if item.log_key is not None and self._by_key.get(item.log_key) is item:
+                del self._by_key[item.log_key]
+                if item.log_type is not None:
+                    self._by_type.get(item.log_type, set()).discard(item.log_key)
+
+    def load(self) -> int:
+        """Page through ``/extralog/list`` and index every entry.
+
+        Returns the number of items indexed.
+        """
+        page = 0
+        seen = 0
+        while True:
+            data = self.client.extralog_list_typed(page, self.page_size, "", "")
+            for item in data.list:
+                self._index(item)
+            seen += len(data.list)
+            if not data.list or seen >= data.totalNum:
+                return seen
+            page += 1
+
+    def invalidate(self) -> None:
+        """Drop every cached item; the next reads go back to the service."""
+        with self._lock:
+            self._by_id.clear()
+            self._by_key.clear()
+            self._by_type.clear()
+
+    # --- Reads ---
+    def get(self, log_id: int) -> ExtralogItem:
+        with self._lock:
+            item = self._by_id.get(log_id)
+        if item is None:
+            item = self.client.extralog_detail_typed(log_id)
+            self._index(item)
+        return item
+
+    def get_by_key(self, log_key: str) -> Optional[ExtralogItem]:
+        with self._lock:
+            item = self._by_key.get(log_key)
+        if item is not None:
+            return item
+        data = self.client.extralog_list_typed(0, self.page_size, "log_key", log_key)
+        for candidate in data.list:
+            self._index(candidate)
+        with self._lock:
+            return self._by_key.get(log_key)
+
+    def find(
+        self, *, log_type: Optional[str] = None, log_key: Optional[str] = None
+    ) -> list[ExtralogItem]:
+        """Query the local index only; call ``load()`` first for full results."""
+        with self._lock:
+            if log_key is not None:
+                item = self._by_key.get(log_key)
+                items = [item] if item is not None else []
+            elif log_type is not None:
+                items = [self._by_key[k] for k in self._by_type.get(log_type, ())]
+            else:
+                items = list(self._by_key.values())
+        if log_type is not None:
+            items = [i for i in items if i.log_type == log_type]
+        return items
+
+    # --- Writes ---
+    def add(
+        self,
+        log_key: str,
+        log_name: str,
+        log_value: str,
+        log_type: str,
+        **fields: Any,
+    ) -> ExtralogItem:
+        """Queue an ``/extralog/add`` and return the not-yet-saved item.
+
+        The item is indexed immediately (without an ``id``) so reads see it;
+        it is replaced by the saved item once the write is flushed.
+        """
+        self._check_open()
+        data: dict[str, Any] = {
+            "log_key": log_key,
+            "log_name": log_name,
+            "log_value": log_value,
+            "log_type": log_type,
+        }
+        data.update({k: v for k, v in fields.items() if v is not None})
+        item = ExtralogItem(**data)
+        self._index(item)
+        self._queue.put(("add", item, data))
+        return item
+
+    def update(self, log_id: int, **fields: Any) -> None:
+        """Queue an ``/extralog/update`` and apply it to the cached item."""
+        self._check_open()
+        with self._lock:
+            item = self._by_id.get(log_id)
+            if item is not None:
+                self._unindex(item)
+                for name, value in fields.items():
+                    setattr(item, name, value)
+                self._index(item)
+        self._queue.put(("update", log_id, dict(fields)))
+
+    def delete(self, log_id: int) -> Any:
+        """Flush pending writes, then delete synchronously."""
+        self.flush()
+        with self._lock:
+            item = self._by_id.get(log_id)
+        if item is not None:
+            self._unindex(item)
+        return self.client.extralog_delete(log_id)
+
+    def flush(self) -> None:
+        """Block until every queued write is sent.
+
+        Raises the first error from the background writer, if any.
+        """
+        self._queue.join()
+        errors = _drain(self._errors)
+        if errors:
+            raise errors[0]
+
+    def close(self) -> None:
+        """Flush pending writes and stop the background writer."""
+        if self._finalizer.detach() is None:
+            return
+        self._closed = True
+        _stop(self._queue, self._worker)
+        errors = _drain(self._errors)
+        if errors:
+            raise errors[0]
+
+    @property
+    def pending(self) -> int:
+        """Approximate number of writes not yet sent."""
+        return self._queue.unfinished_tasks
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise BitBrowserError("ExtralogStore is closed")
+
+    def _saved(self, pending: ExtralogItem, saved: ExtralogItem) -> None:
+        self._unindex(pending)
+        if saved.log_key is None:
+            # Some service versions only echo the new id back.
+            pending.id = saved.id
+            saved = pending
+        self._index(saved)
+
+
+def _write_loop(
+    ops: queue.Queue,
+    client: BrowserClient,
+    errors: list[BaseException],
+    on_saved: Callable[[], Optional[Callable[[ExtralogItem, ExtralogItem], None]]],
+) -> None:
+    while True:
+        op = ops.get()
+        try:
+            if op is _STOP:
+                return
+            if op[0] == "add":
+                _, pending, data = op
+                saved = client.extralog_add_typed(**data)
+                callback = on_saved()
+                if callback is not None:
+                    callback(pending, saved)
+            elif op[0] == "update":
+                _, log_id, fields = op
+                client.extralog_update(log_id, **fields)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            ops.task_done()
+
+
+def _drain(errors: list[BaseException]) -> list[BaseException]:
+    # The writer appends without a lock; only remove what was copied.
+    drained = errors[:]
+    del errors[: len(drained)]
+    return drained
+
+
+def _stop(ops: queue.Queue, worker: threading.Thread) -> None:
+    ops.put(_STOP)
+    worker.join()
+
+
+def _finalize(ops: queue.Queue, worker: threading.Thread, errors: list[BaseException]) -> None:
+    # Runs at garbage collection or interpreter exit: log, never raise.
+    try:
+        _stop(ops, worker)
+    except Exception:
+        logger.exception("failed to flush ExtralogStore")
+    for error in _drain(errors):
+        logger.error("ExtralogStore write failed: %s", error, exc_info=error)
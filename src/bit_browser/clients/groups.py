@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Mapping, Optional
+
+from bit_browser.models.group import Group
+
+if TYPE_CHECKING:
+    from bit_browser.clients.browser import BrowserClient
+
+DEFAULT_TTL = 60.0
+DEFAULT_MISS_REFRESH_INTERVAL = 5.0
+DEFAULT_CHUNK_SIZE = 1000
+
+
+class GroupIndex:
+    """Cached ``name <-> id`` lookup over ``/group/list``.
+
+    The index is rebuilt from ``group_list_typed`` on first use and again
+    once it is older than ``ttl`` seconds, or when a name/id misses (a group
+    may have been created elsewhere) and the index is older than
+    ``miss_refresh_interval`` seconds, so repeated misses don't re-page
+    ``/group/list``. Every lookup accepts either a group name or a group id.
+    """
+
+    def __init__(
+        self,
+        client: BrowserClient,
+        *,
+        ttl: float = DEFAULT_TTL,
+        miss_refresh_interval: float = DEFAULT_MISS_REFRESH_INTERVAL,
+        page_size: int = 100,
+    ):
+        """
+        Args:
+            client (BrowserClient): Client used to reach the service.
+            ttl (float, optional): Seconds before the index is refreshed.
+                Defaults to DEFAULT_TTL.
+            miss_refresh_interval (float, optional): Minimum index age before
+                a missed lookup triggers a refresh. Defaults to
+                DEFAULT_MISS_REFRESH_INTERVAL.
+            page_size (int, optional): Page size for ``/group/list``.
+                Defaults to 100.
+        """
+        self.client = client
+        self.ttl = ttl
+        self.miss_refresh_interval = miss_refresh_interval
+        self.page_size = page_size
+        self._lock = threading.RLock()
+        self._by_id: dict[str, Group] = {}
+        self._by_name: dict[str, Group] = {}
+        self._loaded_at: Optional[float] = None
+
+    # --- Index ---
+    def refresh(self) -> None:
+        """Reload every group from the service."""
+        groups: list[Group] = []
+        page = 0
+        while True:
+            data = self.client.group_list_typed(page=page, page_size=self.page_size)
+            groups.extend(data.list)
+            if not data.list or len(groups) >= data.totalNum:
+                break
+            page += 1
+        with self._lock:
+            self._by_id = {g.id: g for g in groups}
+            self._by_name = {}
+            for g in _sorted(groups):
+                # Duplicate names are allowed by BitBrowser; the lowest
+                # sortNum wins, matching the order the app displays.
+                self._by_name.setdefault(g.groupName, g)
+            self._loaded_at = time.monotonic()
+
+    def _older_than(self, seconds: float) -> bool:
+        with self._lock:
+            return self._loaded_at is None or time.monotonic() - self._loaded_at > seconds
+
+    def _ensure_fresh(self) -> None:
+        if self._older_than(self.ttl):
+            self.refresh()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._loaded_at = None
+
+    def groups(self) -> list[Group]:
+        """All groups ordered by ``sortNum``."""
+        self._ensure_fresh()
+        with self._lock:
+            return _sorted(list(self._by_id.values()))
+
+    def get(self, name_or_id: str) -> Optional[Group]:
+        self._ensure_fresh()
+        group = self._lookup(name_or_id)
+        if group is None and self._older_than(self.miss_refresh_interval):
+            self.refresh()
+            group = self._lookup(name_or_id)
+        return group
+
+    def _lookup(self, name_or_id: str) -> Optional[Group]:
+        with self._lock:
+            return self._by_id.get(name_or_id) or self._by_name.get(name_or_id)
+
+    def resolve(self, name_or_id: str) -> str:
+        """Return the group id for a name or id; raise ``ValueError`` if unknown."""
+        group = self.get(name_or_id)
+        if group is None:
+            raise ValueError(f"unknown group {name_or_id!r}")
+        return group.id
+
+    def id_of(self, name: str) -> str:
+        return self.resolve(name)
+
+    def name_of(self, group_id: str) -> str:
+        group = self.get(group_id)
+        if group is None:
+            raise ValueError(f"unknown group {group_id!r}")
+        return group.groupName
+
+    def __contains__(self, name_or_id: str) -> bool:
+        return self.get(name_or_id) is not None
+
+    def ensure(self, group_name: str, sort_num: Optional[int] = None) -> Group:
+        """Return the group named ``group_name``, creating it if missing."""
+        group = self.get(group_name)
+        if group is None:
+            group = self.client.group_add_typed(group_name, sort_num)
+            with self._lock:
+                self._by_id[group.id] = group
+                self._by_name.setdefault(group.groupName, group)
+        return group
+
+    # --- Rebalancing ---
+    def current_groups(self, browser_ids: list[str]) -> dict[str, Optional[str]]:
+        """Page ``/browser/list`` until every id's ``groupId`` is known."""
+        wanted = set(browser_ids)
+        found: dict[str, Optional[str]] = {}
+        page = 0
+        seen = 0
+        while wanted:
+            data = self.client.list_browsers_typed(page=page, page_size=self.page_size)
+            for profile in data.list:
+                if profile.id in wanted:
+                    found[profile.id] = profile.groupId
+                    wanted.discard(profile.id)
+            seen += len(data.list)
+            if not data.list or seen >= data.totalNum:
+                break
+            page += 1
+        return found
+
+    def plan_rebalance(
+        self,
+        desired: Mapping[str, str],
+        *,
+        current: Optional[Mapping[str, Optional[str]]] = None,
+        create_missing: bool = False,
+    ) -> dict[str, list[str]]:
+        """Compute the moves needed to reach ``desired``.
+
+        Args:
+            desired (Mapping[str, str]): Profile id -> group name or id.
+            current (Optional[Mapping], optional): Profile id -> current
+                ``groupId``. Fetched from ``/browser/list`` when omitted.
+            create_missing (bool, optional): Create groups named in
+                ``desired`` that don't exist yet. Defaults to False.
+
+        Returns:
+            dict[str, list[str]]: Target group id -> profile ids to move
+            there. Profiles already in their target group are left out.
+        """
+        targets: dict[str, str] = {}
+        for target in set(desired.values()):
+            if create_missing:
+                targets[target] = self.ensure(target).id
+            else:
+                targets[target] = self.resolve(target)
+
+        if current is None:
+            current = self.current_groups(list(desired))
+
+        moves: dict[str, list[str]] = {}
+        for browser_id, target in desired.items():
+            group_id = targets[target]
+            if current.get(browser_id) != group_id:
+                moves.setdefault(group_id, []).append(browser_id)
+        return moves
+
+    def rebalance(
+        self,
+        desired: Mapping[str, str],
+        *,
+        current: Optional[Mapping[str, Optional[str]]] = None,
+        create_missing: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        dry_run: bool = False,
+    ) -> dict[str, list[str]]:
+        """Move profiles so each sits in its ``desired`` group.
+
+        Sends one ``/browser/group/update`` per target group (split into
+        ``chunk_size`` batches for very large moves). See
+        :meth:`plan_rebalance` for arguments; returns the executed plan.
+        """
+        moves = self.plan_rebalance(desired, current=current, create_missing=create_missing)
+        if not dry_run:
+            for group_id, browser_ids in moves.items():
+                for i in range(0, len(browser_ids), chunk_size):
+                    self.client.update_group(group_id, browser_ids[i : i + chunk_size])
+        return moves
+
+
+def _sorted(groups: list[Group]) -> list[Group]:
+    return sorted(groups, key=lambda g: (g.sortNum is None, g.sortNum or 0, g.groupName))
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Optional, Sequence
+
+from bit_browser._compat import model_validate
+from bit_browser.errors import ResponseValidationError
+from bit_browser.models.display import Display
+from bit_browser.models.misc import WindowBoundsRequest
+
+if TYPE_CHECKING:
+    from bit_browser.clients.browser import BrowserClient
+
+DEFAULT_DISPLAY_TTL = 300.0
+
+
+class WindowLayoutPlanner:
+    """Tile open windows across every display with one request per screen.
+
+    ``/alldisplays`` is read once and cached for ``display_ttl`` seconds.
+    Windows are ordered by ``seq`` and split across displays in proportion to
+    their usable area (left to right), then a ``box`` grid is computed for
+    each display locally. Applying a layout sends one ``/windowbounds`` call
+    per display that received windows.
+
+    Coordinates are relative to the display chosen with ``screenId``. When a
+    grid cell would be smaller than ``min_width`` x ``min_height`` the
+    windows keep the minimum size and overlap (negative spacing).
+    """
+
+    def __init__(
+        self,
+        client: BrowserClient,
+        *,
+        space_x: int = 0,
+        space_y: int = 0,
+        margin: int = 0,
+        min_width: int = 400,
+        min_height: int = 300,
+        aspect: float = 16 / 10,
+        display_ttl: float = DEFAULT_DISPLAY_TTL,
+        page_size: int = 100,
+    ):
+        """
+        Args:
+            client (BrowserClient): Client used to reach the service.
+            space_x (int, optional): Horizontal gap between windows.
+            space_y (int, optional): Vertical gap between windows.
+            margin (int, optional): Gap between the grid and the screen edge.
+            min_width (int, optional): Smallest window width. Defaults to 400.
+            min_height (int, optional): Smallest window height. Defaults to 300.
+            aspect (float, optional): Preferred width/height ratio when
+                choosing the column count. Defaults to 16/10.
+            display_ttl (float, optional): Seconds to cache the display
+                topology. Defaults to DEFAULT_DISPLAY_TTL.
+            page_size (int, optional): Page size used to look up ``seq`` of
+                open profiles. Defaults to 100.
+        """
+        self.client = client
+        self.space_x = space_x
+        self.space_y = space_y
+        self.margin = margin
+        self.min_width = min_width
+        self.min_height = min_height
+        self.aspect = aspect
+        self.display_ttl = display_ttl
+        self.page_size = page_size
+        self._lock = threading.Lock()
+        self._displays: Optional[list[Display]] = None
+        self._loaded_at = 0.0
+
+    # --- Inputs ---
+    def displays(self, *, refresh: bool = False) -> list[Display]:
+        """Displays ordered left to right, cached between calls."""
+        with self._lock:
+            fresh = (
+                self._displays is not None
+                and time.monotonic() - self._loaded_at <= self.display_ttl
+            )
+            if fresh and not refresh:
+                return list(self._displays)  # type: ignore[arg-type]
+        displays = _parse_displays(self.client.get_all_displays())
+        displays.sort(key=lambda d: (d.area.x, d.area.y))
+        with self._lock:
+            self._displays = displays
+            self._loaded_at = time.monotonic()
+        return list(displays)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._displays = None
+
+    def open_seqs(self) -> list[int]:
+        """``seq`` of every open profile, found via ``/browser/pids/all``."""
+        pids = self.client.get_all_pids() or {}
+        wanted = set(pids)
+        seqs: list[int] = []
+        page = 0
+        seen = 0
+        while wanted:
+            data = self.client.list_browsers_typed(page=page, page_size=self.page_size)
+            for profile in data.list:
+                if profile.id in wanted:
+                    wanted.discard(profile.id)
+                    if profile.seq is not None:
+                        seqs.append(profile.seq)
+            seen += len(data.list)
+            if not data.list or seen >= data.totalNum:
+                break
+            page += 1
+        return sorted(seqs)
+
+    # --- Planning ---
+    def plan(
+        self, seqs: Sequence[int], displays: Optional[Sequence[Display]] = None
+    ) -> list[WindowBoundsRequest]:
+        """Compute one ``/windowbounds`` request per display that gets windows."""
+        if displays is None:
+            displays = self.displays()
+        if not displays:
+            raise ValueError("no displays to tile on")
+        ordered = sorted(seqs)
+        requests: list[WindowBoundsRequest] = []
+        start = 0
+        for display, count in zip(displays, self._split(len(ordered), displays)):
+            if not count:
+                continue
+            chunk = ordered[start : start + count]
+            start += count
+            requests.append(self._grid(display, chunk))
+        return requests
+
+    def apply(
+        self, seqs: Optional[Sequence[int]] = None, *, dry_run: bool = False
+    ) -> list[WindowBoundsRequest]:
+        """Tile ``seqs`` (default: every open profile) and return the plan."""
+        if seqs is None:
+            seqs = self.open_seqs()
+        requests = self.plan(seqs)
+        if not dry_run:
+            for request in requests:
+                self.client.windowbounds_reset(request)
+        return requests
+
+    @staticmethod
+    def _split(n: int, displays: Sequence[Display]) -> list[int]:
+        # Largest-remainder split proportional to usable area.
+        areas = [max(d.area.width * d.area.height, 1) for d in displays]
+        total = sum(areas)
+        exact = [n * a / total for a in areas]
+        counts = [int(e) for e in exact]
+        order = sorted(range(len(displays)), key=lambda i: exact[i] - counts[i], reverse=True)
+        for i in order[: n - sum(counts)]:
+            counts[i] += 1
+        return counts
+
+    def _grid(self, display: Display, seqs: list[int]) -> WindowBoundsRequest:
+        n = len(seqs)
+        usable_w = max(display.area.width - 2 * self.margin, 1)
+        usable_h = max(display.area.height - 2 * self.margin, 1)
+
+        best_col, best_size = 1, -1.0
+        for col in range(1, n + 1):
+            rows = math.ceil(n / col)
+            w = (usable_w - (col - 1) * self.space_x) / col
+            h = (usable_h - (rows - 1) * self.space_y) / rows
+            size = min(w, h * self.aspect)
+            if size > best_size:
+                best_col, best_size = col, size
+        col = best_col
+        rows = math.ceil(n / col)
+        width = (usable_w - (col - 1) * self.space_x) // col
+        height = (usable_h - (rows - 1) * self.space_y) // rows
+        space_x, space_y = self.space_x, self.space_y
+        if width < self.min_width:
+            width = self.min_width
+            space_x = (usable_w - col * width) // (col - 1) if col > 1 else 0
+        if height < self.min_height:
+            height = self.min_height
+            space_y = (usable_h - rows * height) // (rows - 1) if rows > 1 else 0
+
+        return WindowBoundsRequest(
+            type="box",
+            startX=self.margin,
+            startY=self.margin,
+            width=width,
+            height=height,
+            col=col,
+            spaceX=space_x,
+            spaceY=space_y,
+            seqlist=seqs,
+            screenId=display.id,
+        )
+
+
+def _parse_displays(data: Any) -> list[Display]:
+    if isinstance(data, dict):
+        data = data.get("list", data.get("displays", []))
+    try:
+        return [model_validate(Display, d) for d in data or []]
+    except Exception as e:
+        raise ResponseValidationError(str(e)) from e
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import contextvars
+import csv
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional
+
+from bit_browser._compat import field_names, model_validate
+from bit_browser.models.browser import BrowserUpdateRequest
+
+if TYPE_CHECKING:
+    from bit_browser.clients.browser import BrowserClient
+
+
+@dataclass
+class ProvisionFailure:
+    key: str
+    row: dict[str, Any] | str
+    error: BaseException
+
+
+@dataclass
+class InvalidRow:
+    """A JSONL line that didn't decode to an object, as yielded by :func:`read_rows`."""
+
+    line: str
+    error: ValueError
+
+
+@dataclass
+class ProvisionStats:
+    """Running totals for a :func:`provision_profiles` run."""
+
+    created: int = 0
+    skipped: int = 0
+    failed: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+    failures: list[ProvisionFailure] = field(default_factory=list)
+
+    @property
+    def processed(self) -> int:
+        return self.created + self.skipped + self.failed
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    @property
+    def rate(self) -> float:
+        """Profiles created per second."""
+        elapsed = self.elapsed
+        return self.created / elapsed if elapsed > 0 else 0.0
+
+
+def read_rows(path: str | os.PathLike[str]) -> Iterator[dict[str, Any] | InvalidRow]:
+    """Stream rows from a ``.csv`` or ``.jsonl`` file.
+
+    CSV cells that are empty are dropped; a dotted header such as
+    ``browserFingerPrint.coreVersion`` becomes a nested dict. Blank JSONL
+    lines are skipped; a line that isn't a JSON object is yielded as an
+    :class:`InvalidRow` rather than raised, so later rows keep their
+    position.
+    """
+    path = Path(path)
+    with path.open(newline="" if path.suffix.lower() == ".csv" else None, encoding="utf-8") as f:
+        if path.suffix.lower() == ".csv":
+            for raw in csv.DictReader(f):
+                row: dict[str, Any] = {}
+                for name, value in raw.items():
+                    if name is None or value in (None, ""):
+                        continue
+                    target = row
+                    *parents, leaf = name.split(".")
+                    for parent in parents:
+                        target = target.setdefault(parent, {})
+                    target[leaf] = value
+                yield row
+        else:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except ValueError as e:
+                    yield InvalidRow(line.rstrip("\n"), e)
+                    continue
+                if isinstance(row, dict):
+                    yield row
+                else:
+                    yield InvalidRow(line.rstrip("\n"), ValueError("expected a JSON object"))
+
+
+def _load_checkpoint(path: Path) -> dict[str, str]:
+    done: dict[str, str] = {}
+    if path.exists():
+        with path.open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # torn last line from a crash
+                done[entry["key"]] = entry["id"]
+    return done
+
+
+def provision_profiles(
+    client: BrowserClient,
+    source: str | os.PathLike[str],
+    *,
+    checkpoint: Optional[str | os.PathLike[str]] = None,
+    key: Optional[str] = None,
+    max_workers: int = 8,
+    progress: Optional[Callable[[ProvisionStats], None]] = None,
+    progress_every: int = 100,
+) -> ProvisionStats:
+    """Create profiles from a CSV/JSONL file with bounded concurrency.
+
+    Rows are read lazily, validated as :class:`BrowserUpdateRequest` one at a
+    time and sent through ``browser_update_typed`` by up to ``max_workers``
+    threads; at most ``2 * max_workers`` rows are held in memory.
+
+    Each created profile is appended to ``checkpoint`` (JSONL of
+    ``{"key", "id"}``) as soon as it succeeds, so a rerun with the same
+    checkpoint skips rows that are already done. Rows are keyed by the
+    ``key`` column when given, else by their position in the file. The
+    ``key`` column isn't sent unless it is a :class:`BrowserUpdateRequest`
+    field, and a row without it counts as invalid.
+
+    Invalid rows and failed requests are counted and kept in
+    ``stats.failures``; they don't stop the run. ``progress`` is called
+    every ``progress_every`` processed rows and once at the end.
+    """
+    stats = ProvisionStats()
+    checkpoint_path = Path(checkpoint) if checkpoint is not None else None
+    done = _load_checkpoint(checkpoint_path) if checkpoint_path is not None else {}
+    log = None
+    if checkpoint_path is not None:
+        log = checkpoint_path.open("a+", encoding="utf-8")
+        if log.tell() > 0:
+            log.seek(log.tell() - 1)
+            if log.read(1) != "\n":
+                log.write("\n")  # start fresh after a torn last line
+
+    def report() -> None:
+        if progress is not None and stats.processed % progress_every == 0:
+            progress(stats)
+
+    def fail(row_key: str, row: dict[str, Any] | str, error: BaseException) -> None:
+        stats.failed += 1
+        stats.failures.append(ProvisionFailure(row_key, row, error))
+        report()
+
+    def finish(future: Future, row_key: str, row: dict[str, Any]) -> None:
+        try:
+            profile = future.result()
+        except Exception as e:
+            fail(row_key, row, e)
+            return
+        stats.created += 1
+        if log is not None:
+            log.write(json.dumps({"key": row_key, "id": profile.id}) + "\n")
+            log.flush()
+        report()
+
+    request_fields = field_names(BrowserUpdateRequest)
+    pending: dict[Future, tuple[str, dict[str, Any]]] = {}
+    pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bitbrowser-provision")
+    try:
+        for index, row in enumerate(read_rows(source)):
+            if isinstance(row, InvalidRow):
+                fail(f"#{index}", row.line, row.error)
+                continue
+            payload = row
+            if key is None:
+                row_key = f"#{index}"
+            elif key not in row:
+                fail(f"#{index}", row, ValueError(f"row has no {key!r} column"))
+                continue
+            else:
+                row_key = str(row[key])
+                if key not in request_fields:
+                    payload = {k: v for k, v in row.items() if k != key}
+            if row_key in done:
+                stats.skipped += 1
+                report()
+                continue
+            try:
+                request = model_validate(BrowserUpdateRequest, payload)
+            except Exception as e:
+                fail(row_key, row, e)
+                continue
+
+            while len(pending) >= 2 * max_workers:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    finish(future, *pending.pop(future))
+            future = pool.submit(
+                contextvars.copy_context().run, client.browser_update_typed, request
+            )
+            pending[future] = (row_key, row)
+
+        for future in wait(pending).done:
+            finish(future, *pending.pop(future))
+    finally:
+        # On an early exit, still checkpoint whatever already finished.
+        pool.shutdown(wait=True, cancel_futures=True)
+        for future in list(pending):
+            if future.done() and not future.cancelled():
+                finish(future, *pending.pop(future))
+        if log is not None:
+            log.close()
+
+    if progress is not None:
+        progress(stats)
+    return stats
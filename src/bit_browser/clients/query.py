@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+from bit_browser.models.browser import BrowserProfile
+
+if TYPE_CHECKING:
+    from bit_browser.clients.browser import BrowserClient
+
+
+@dataclass
+class ProfileFilter:
+    """Structured filter over browser profiles.
+
+    ``name`` and ``remark`` are case-insensitive substring matches, the seq
+    bounds are inclusive and ``proxy_host`` must match exactly. Unset fields
+    don't filter.
+    """
+
+    group_id: Optional[str] = None
+    name: Optional[str] = None
+    remark: Optional[str] = None
+    min_seq: Optional[int] = None
+    max_seq: Optional[int] = None
+    proxy_host: Optional[str] = None
+
+    def server_params(self) -> dict[str, Any]:
+        """The part of the filter ``/browser/list`` evaluates itself.
+
+        The local API supports ``groupId`` and fuzzy ``name``/``remark``
+        matching plus a ``minSeq``/``maxSeq`` range. Proxy fields can't be
+        filtered server-side.
+        """
+        params: dict[str, Any] = {}
+        if self.group_id is not None:
+            params["groupId"] = self.group_id
+        if self.name:
+            params["name"] = self.name
+        if self.remark:
+            params["remark"] = self.remark
+        if self.min_seq is not None:
+            params["minSeq"] = self.min_seq
+        if self.max_seq is not None:
+            params["maxSeq"] = self.max_seq
+        return params
+
+    def matches(self, profile: BrowserProfile) -> bool:
+        """Evaluate the whole filter locally."""
+        if self.group_id is not None and profile.groupId != self.group_id:
+            return False
+        if self.name and self.name.lower() not in (profile.name or "").lower():
+            return False
+        if self.remark and self.remark.lower() not in (profile.remark or "").lower():
+            return False
+        if self.min_seq is not None and (profile.seq is None or profile.seq < self.min_seq):
+            return False
+        if self.max_seq is not None and (profile.seq is None or profile.seq > self.max_seq):
+            return False
+        if self.proxy_host is not None and profile.host != self.proxy_host:
+            return False
+        return True
+
+
+def query_browsers(
+    client: BrowserClient,
+    flt: ProfileFilter,
+    *,
+    page_size: int = 100,
+    pushdown: bool = True,
+) -> Iterator[BrowserProfile]:
+    """Stream profiles matching ``flt``, page by page.
+
+    Server-supported parts of the filter are sent as ``list_browsers``
+    filters so fewer profiles cross the wire; the full filter is then
+    re-checked locally, which also covers fields the server can't filter
+    and any looser server-side matching. ``pushdown=False`` fetches every
+    profile and filters only locally.
+    """
+    params = flt.server_params() if pushdown else {}
+    page = 0
+    seen = 0
+    while True:
+        data = client.list_browsers_typed(page=page, page_size=page_size, **params)
+        for profile in data.list:
+            if flt.matches(profile):
+                yield profile
+        seen += len(data.list)
+        if not data.list or seen >= data.totalNum:
+            return
+        page += 1
@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import contextvars
+import heapq
+import itertools
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Callable, Optional
+
+if TYPE_CHECKING:
+    from bit_browser.clients.browser import BrowserClient
+
+DEFAULT_TASK_TIMEOUT = 600.0
+
+
+class TaskState(Enum):
+    queued = "queued"
+    running = "running"
+    done = "done"
+    stopped = "stopped"
+    failed = "failed"
+    cancelled = "cancelled"
+
+
+@dataclass
+class RpaTask:
+    task_id: str
+    priority: int = 0
+    state: TaskState = TaskState.queued
+    submitted_at: float = 0.0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def runtime(self) -> Optional[float]:
+        if self.started_at is None:
+            return None
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+
+@dataclass
+class RpaMetrics:
+    queued: int
+    running: int
+    done: int
+    stopped: int
+    failed: int
+    cancelled: int
+    elapsed: float
+
+    @property
+    def finished(self) -> int:
+        return self.done + self.stopped + self.failed
+
+    @property
+    def throughput(self) -> float:
+        """Finished tasks per second since the scheduler started."""
+        return self.finished / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class RpaScheduler:
+    """Run queued RPA tasks with at most ``max_running`` at a time.
+
+    Tasks are started with ``rpa_run`` in priority order (higher first, FIFO
+    within a priority) by a background thread. The local API has no status
+    endpoint, so without ``is_done`` a task counts as done as soon as
+    ``rpa_run`` succeeds. With ``is_done``, a running task holds its slot
+    until ``is_done(task_id)`` returns True, :meth:`mark_done` is called, or
+    it exceeds ``timeout`` seconds, in which case it is stopped with
+    ``rpa_stop``::
+
+        with RpaScheduler(client, max_running=8, timeout=300, is_done=check) as scheduler:
+            for task_id in task_ids:
+                scheduler.submit(task_id)
+            scheduler.join()
+        print(scheduler.metrics().throughput)
+    """
+
+    def __init__(
+        self,
+        client: BrowserClient,
+        *,
+        max_running: int = 4,
+        timeout: float = DEFAULT_TASK_TIMEOUT,
+        poll_interval: float = 1.0,
+        is_done: Optional[Callable[[str], bool]] = None,
+    ):
+        """
+        Args:
+            client (BrowserClient): Client used for ``rpa_run``/``rpa_stop``.
+            max_running (int, optional): Concurrent task limit. Defaults to 4.
+            timeout (float, optional): Seconds before a running task is
+                stopped. Defaults to DEFAULT_TASK_TIMEOUT.
+            poll_interval (float, optional): Seconds between status checks.
+                Defaults to 1.0.
+            is_done (Optional[Callable[[str], bool]], optional): Returns True
+                once a task has finished. Pass ``lambda task_id: False`` to
+                rely on :meth:`mark_done` and ``timeout`` alone. Defaults to
+                None, which treats a successful ``rpa_run`` as done.
+        """
+        self.client = client
+        self.max_running = max_running
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.is_done = is_done
+        self.tasks: dict[str, RpaTask] = {}
+        self._queue: list[tuple[int, int, str]] = []
+        self._order = itertools.count()
+        self._cond = threading.Condition()
+        self._stopping = False
+        self._started_at: Optional[float] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> RpaScheduler:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop(stop_running=exc_type is not None)
+
+    # --- Control ---
+    def start(self) -> None:
+        with self._cond:
+            if self._thread is not None:
+                return
+            self._stopping = False
+            self._started_at = time.monotonic()
+            ctx = contextvars.copy_context()
+            self._thread = threading.Thread(
+                target=ctx.run, args=(self._run,), name="bitbrowser-rpa", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, *, stop_running: bool = False, wait: bool = True) -> None:
+        """Stop scheduling; optionally ``rpa_stop`` tasks still running."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+            thread, self._thread = self._thread, None
+        if thread is not None and wait:
+            thread.join()
+        if stop_running:
+            for task in self._in_state(TaskState.running):
+                self._stop_task(task)
+
+    def submit(self, task_id: str, priority: int = 0) -> RpaTask:
+        """Queue ``task_id``; a task already queued or running is returned as is."""
+        with self._cond:
+            task = self.tasks.get(task_id)
+            if task is not None and task.state in (TaskState.queued, TaskState.running):
+                return task
+            task = RpaTask(task_id=task_id, priority=priority, submitted_at=time.monotonic())
+            self.tasks[task_id] = task
+            heapq.heappush(self._queue, (-priority, next(self._order), task_id))
+            self._cond.notify_all()
+            return task
+
+    def cancel(self, task_id: str) -> bool:
+        """Drop a queued task. Returns False if it already started."""
+        with self._cond:
+            task = self.tasks.get(task_id)
+            if task is None or task.state is not TaskState.queued:
+                return False
+            task.state = TaskState.cancelled
+            task.finished_at = time.monotonic()
+            self._cond.notify_all()
+            return True
+
+    def mark_done(self, task_id: str) -> None:
+        """Report that a running task finished, freeing its slot."""
+        with self._cond:
+            task = self.tasks.get(task_id)
+            if task is not None and task.state is TaskState.running:
+                task.state = TaskState.done
+                task.finished_at = time.monotonic()
+                self._cond.notify_all()
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait until nothing is queued or running. Returns False on timeout."""
+        end = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._in_state(TaskState.queued) or self._in_state(TaskState.running):
+                remaining = None if end is None else end - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    # --- Status ---
+    def status(self, task_id: str) -> Optional[TaskState]:
+        task = self.tasks.get(task_id)
+        return task.state if task is not None else None
+
+    def metrics(self) -> RpaMetrics:
+        with self._cond:
+            counts = {state: 0 for state in TaskState}
+            for task in self.tasks.values():
+                counts[task.state] += 1
+            elapsed = time.monotonic() - self._started_at if self._started_at else 0.0
+        return RpaMetrics(
+            queued=counts[TaskState.queued],
+            running=counts[TaskState.running],
+            done=counts[TaskState.done],
+            stopped=counts[TaskState.stopped],
+            failed=counts[TaskState.failed],
+            cancelled=counts[TaskState.cancelled],
+            elapsed=elapsed,
+        )
+
+    # --- Worker ---
+    def _in_state(self, state: TaskState) -> list[RpaTask]:
+        return [t for t in self.tasks.values() if t.state is state]
+
+    def _finish(self, task: RpaTask, state: TaskState, error: Optional[BaseException] = None) -> None:
+        with self._cond:
+            if task.state is TaskState.running:
+                task.state = state
+                task.error = error
+                task.finished_at = time.monotonic()
+                self._cond.notify_all()
+
+    def _stop_task(self, task: RpaTask) -> None:
+        try:
+            self.client.rpa_stop(task.task_id)
+        except Exception as e:
+            self._finish(task, TaskState.failed, e)
+        else:
+            self._finish(task, TaskState.stopped)
+
+    def _next_queued(self) -> Optional[RpaTask]:
+        # Caller holds the lock.
+        while self._queue:
+            _, _, task_id = heapq.heappop(self._queue)
+            task = self.tasks.get(task_id)
+            if task is not None and task.state is TaskState.queued:
+                return task
+        return None
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if self._stopping:
+                    return
+                running = self._in_state(TaskState.running)
+                to_start: list[RpaTask] = []
+                while len(running) + len(to_start) < self.max_running:
+                    task = self._next_queued()
+                    if task is None:
+                        break
+                    task.state = TaskState.running
+                    task.started_at = time.monotonic()
+                    to_start.append(task)
+
+            for task in to_start:
+                try:
+                    self.client.rpa_run(task.task_id)
+                except Exception as e:
+                    self._finish(task, TaskState.failed, e)
+                else:
+                    if self.is_done is None:
+                        self._finish(task, TaskState.done)
+
+            now = time.monotonic()
+            for task in running:
+                if task.started_at is not None and now - task.started_at > self.timeout:
+                    self._stop_task(task)
+                elif self.is_done is not None:
+                    try:
+                        finished = self.is_done(task.task_id)
+                    except Exception:
+                        finished = False
+                    if finished:
+                        self._finish(task, TaskState.done)
+
+            with self._cond:
+                if to_start and self._queue:
+                    continue  # a start may have finished immediately; refill now
+                self._cond.wait(self.poll_interval)
@@ -0,0 +1,398 @@
+from __future__ import annotations
+
+import contextvars
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Iterator, Optional, Sequence, TypeVar
+
+from bit_browser.clients.browser import BrowserClient
+from bit_browser.errors import APIError, BitBrowserError, DeadlineExceededError, NetworkError
+from bit_browser.models.browser import (
+    BrowserListData,
+    BrowserOpenData,
+    BrowserProfile,
+    BrowserUpdateRequest,
+)
+
+T = TypeVar("T")
+
+# How long an instance that failed to connect is skipped before being retried.
+DEFAULT_DOWN_COOLDOWN = 30.0
+# Page size for the /browser/list sweep that resolves unknown ids in bulk.
+SWEEP_PAGE_SIZE = 100
+
+
+class ShardedClient:
+    """Drive several BitBrowser hosts as one fleet.
+
+    Per-profile calls are routed to the instance that owns the profile. The
+    owner is learned from list/create results, or found by probing
+    ``/browser/detail`` on every healthy instance the first time an unknown
+    id is used. Bulk calls resolve all their unknown ids at once with one
+    concurrent ``/browser/list`` sweep per instance. List and bulk calls fan
+    out to all instances in parallel and their results are merged.
+
+    Instances that raise :class:`NetworkError` are marked down for
+    ``down_cooldown`` seconds and skipped by fan-out, probing and creation.
+    """
+
+    def __init__(
+        self,
+        clients: Sequence[BrowserClient | str],
+        *,
+        token: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        down_cooldown: float = DEFAULT_DOWN_COOLDOWN,
+    ):
+        """
+        Args:
+            clients (Sequence[BrowserClient | str]): Clients, or base URLs to
+                build clients for.
+            token (Optional[str], optional): Token used for clients built from
+                URLs. Defaults to None.
+            max_workers (Optional[int], optional): Fan-out threads. Defaults
+                to one per instance.
+            down_cooldown (float, optional): Seconds to skip an unreachable
+                instance. Defaults to DEFAULT_DOWN_COOLDOWN.
+        """
+        if not clients:
+            raise ValueError("at least one client is required")
+        self.clients: list[BrowserClient] = [
+            c if isinstance(c, BrowserClient) else BrowserClient(url=c, token=token)
+            for c in clients
+        ]
+        self.down_cooldown = down_cooldown
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or len(self.clients),
+            thread_name_prefix="bitbrowser-shard",
+        )
+        self._lock = threading.Lock()
+        self._owners: dict[str, BrowserClient] = {}
+        self._down_until: dict[int, float] = {}
+        self._next = 0
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> ShardedClient:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    # --- Health ---
+    def is_healthy(self, client: BrowserClient) -> bool:
+        with self._lock:
+            if self._down_until.get(id(client), 0.0) > time.monotonic():
+                return False
+        return client.cached_health() is not False
+
+    def healthy_clients(self) -> list[BrowserClient]:
+        return [c for c in self.clients if self.is_healthy(c)]
+
+    def _mark_down(self, client: BrowserClient) -> None:
+        with self._lock:
+            self._down_until[id(client)] = time.monotonic() + self.down_cooldown
+
+    def _call(self, client: BrowserClient, fn: Callable[[BrowserClient], T]) -> T:
+        try:
+            return fn(client)
+        except NetworkError:
+            self._mark_down(client)
+            raise
+
+    # --- Ownership ---
+    def learn(self, browser_id: str, client: BrowserClient) -> None:
+        """Record that ``browser_id`` lives on ``client``."""
+        with self._lock:
+            self._owners[browser_id] = client
+
+    def forget(self, browser_id: str) -> None:
+        with self._lock:
+            self._owners.pop(browser_id, None)
+
+    def owner(self, browser_id: str) -> BrowserClient:
+        """Return the instance owning ``browser_id``, probing if unknown."""
+        with self._lock:
+            client = self._owners.get(browser_id)
+        if client is not None:
+            return client
+
+        def probe(c: BrowserClient) -> bool:
+            try:
+                self._call(c, lambda c: c.browser_detail({"id": browser_id}))
+            except DeadlineExceededError:
+                raise
+            except BitBrowserError:
+                return False
+            return True
+
+        candidates = self.healthy_clients()
+        for c, found in zip(candidates, self._map(probe, candidates)):
+            if found:
+                self.learn(browser_id, c)
+                return c
+        raise APIError(f"browser {browser_id!r} not found on any healthy instance")
+
+    def owners(self, browser_ids: Sequence[str]) -> dict[str, BrowserClient]:
+        """Return the owning instance of every id in ``browser_ids``.
+
+        A single unknown id is probed like :meth:`owner`; several are found
+        by paging ``/browser/list`` on every healthy instance in parallel,
+        each sweep stopping once all of them are known.
+        """
+        with self._lock:
+            found = {i: self._owners[i] for i in browser_ids if i in self._owners}
+        missing = {i for i in browser_ids if i not in found}
+        if len(missing) == 1:
+            (browser_id,) = missing
+            found[browser_id] = self.owner(browser_id)
+        elif missing:
+            self._sweep(missing)
+            with self._lock:
+                found.update({i: self._owners[i] for i in missing if i in self._owners})
+            lost = sorted(missing - found.keys())
+            if lost:
+                raise APIError(f"browsers {lost!r} not found on any healthy instance")
+        return found
+
+    def _sweep(self, missing: set[str]) -> None:
+        remaining = set(missing)
+
+        def sweep(c: BrowserClient) -> None:
+            page = 0
+            while True:
+                with self._lock:
+                    if not remaining:
+                        return
+                data = c.list_browsers_typed(page, SWEEP_PAGE_SIZE)
+                for profile in data.list:
+                    if profile.id:
+                        self.learn(profile.id, c)
+                with self._lock:
+                    remaining.difference_update(p.id for p in data.list)
+                if not data.list or (page + 1) * SWEEP_PAGE_SIZE >= data.totalNum:
+                    return
+                page += 1
+
+        self._fan_out(sweep)
+
+    def _group_by_owner(self, ids: Sequence[str]) -> dict[int, tuple[BrowserClient, list[str]]]:
+        groups: dict[int, tuple[BrowserClient, list[str]]] = {}
+        owners = self.owners(ids)
+        for browser_id in ids:
+            c = owners[browser_id]
+            groups.setdefault(id(c), (c, []))[1].append(browser_id)
+        return groups
+
+    def _pick_for_create(self) -> BrowserClient:
+        candidates = self.healthy_clients()
+        if not candidates:
+            raise NetworkError("no healthy BitBrowser instance available")
+        with self._lock:
+            client = candidates[self._next % len(candidates)]
+            self._next += 1
+        return client
+
+    # --- Fan-out helpers ---
+    def _submit(self, fn: Callable[..., T], *args: Any) -> Future:
+        # Run in a copy of the caller's context so an active Deadline applies.
+        return self._executor.submit(contextvars.copy_context().run, fn, *args)
+
+    def _map(self, fn: Callable[[Any], T], items: Sequence[Any]) -> list[T]:
+        return [f.result() for f in [self._submit(fn, item) for item in items]]
+
+    def _fan_out(
+        self, fn: Callable[[BrowserClient], T], clients: Sequence[BrowserClient] | None = None
+    ) -> list[tuple[BrowserClient, T]]:
+        """Run ``fn`` on each healthy instance; unreachable ones are skipped."""
+        targets = list(clients) if clients is not None else self.healthy_clients()
+
+        def run(c: BrowserClient) -> tuple[bool, Any]:
+            try:
+                return True, self._call(c, fn)
+            except NetworkError as e:
+                return False, e
+
+        out: list[tuple[BrowserClient, T]] = []
+        for c, (ok, result) in zip(targets, self._map(run, targets)):
+            if ok:
+                out.append((c, result))
+        return out
+
+    def _by_owner(
+        self, ids: Sequence[str], fn: Callable[[BrowserClient, list[str]], Any]
+    ) -> Any:
+        groups = list(self._group_by_owner(ids).values())
+        futures = [self._submit(self._call, c, lambda c, i=i: fn(c, i)) for c, i in groups]
+        return _merge([f.result() for f in futures])
+
+    # --- Per-profile calls ---
+    def _route(self, request: Any, fn: Callable[[BrowserClient], T]) -> T:
+        browser_id = _request_id(request)
+        return self._call(self.owner(browser_id), fn)
+
+    def browser_update(self, request: BrowserUpdateRequest | dict[str, Any]) -> Any:
+        browser_id = _request_id(request, required=False)
+        if browser_id:
+            return self._call(self.owner(browser_id), lambda c: c.browser_update(request))
+        client = self._pick_for_create()
+        data = self._call(client, lambda c: c.browser_update(request))
+        if isinstance(data, dict) and data.get("id"):
+            self.learn(data["id"], client)
+        return data
+
+    def browser_update_typed(self, request: BrowserUpdateRequest | dict[str, Any]) -> BrowserProfile:
+        browser_id = _request_id(request, required=False)
+        if browser_id:
+            return self._call(self.owner(browser_id), lambda c: c.browser_update_typed(request))
+        client = self._pick_for_create()
+        profile = self._call(client, lambda c: c.browser_update_typed(request))
+        if profile.id:
+            self.learn(profile.id, client)
+        return profile
+
+    def browser_open(self, request: Any) -> Any:
+        return self._route(request, lambda c: c.browser_open(request))
+
+    def browser_open_typed(self, request: Any) -> BrowserOpenData:
+        return self._route(request, lambda c: c.browser_open_typed(request))
+
+    def browser_close(self, request: Any) -> Any:
+        return self._route(request, lambda c: c.browser_close(request))
+
+    def browser_delete(self, request: Any) -> Any:
+        result = self._route(request, lambda c: c.browser_delete(request))
+        self.forget(_request_id(request))
+        return result
+
+    def browser_detail(self, request: Any) -> Any:
+        return self._route(request, lambda c: c.browser_detail(request))
+
+    def browser_detail_typed(self, request: Any) -> BrowserProfile:
+        return self._route(request, lambda c: c.browser_detail_typed(request))
+
+    def users_reset_closed_state(self, request: Any) -> Any:
+        return self._route(request, lambda c: c.users_reset_closed_state(request))
+
+    def open_browser(self, browser_id: str, args: list[str] | None = None, queue: bool | None = None) -> Any:
+        return self._call(self.owner(browser_id), lambda c: c.open_browser(browser_id, args, queue))
+
+    def close_browser(self, browser_id: str) -> Any:
+        return self.browser_close({"id": browser_id})
+
+    def delete_browser(self, browser_id: str) -> Any:
+        return self.browser_delete({"id": browser_id})
+
+    def get_browser_details(self, browser_id: str) -> Any:
+        return self.browser_detail({"id": browser_id})
+
+    def cookies_set(self, browser_id: str, cookies: list[dict]) -> Any:
+        return self._call(self.owner(browser_id), lambda c: c.cookies_set(browser_id, cookies))
+
+    def cookies_get(self, browser_id: str) -> Any:
+        return self._call(self.owner(browser_id), lambda c: c.cookies_get(browser_id))
+
+    def cookies_clear(self, browser_id: str, save_synced: bool = True) -> Any:
+        return self._call(self.owner(browser_id), lambda c: c.cookies_clear(browser_id, save_synced))
+
+    def fingerprint_random(self, browser_id: str) -> Any:
+        return self._call(self.owner(browser_id), lambda c: c.fingerprint_random(browser_id))
+
+    def autopaste(self, browser_id: str, url: str) -> Any:
+        return self._call(self.owner(browser_id), lambda c: c.autopaste(browser_id, url))
+
+    # --- Bulk calls (split by owner) ---
+    def get_pids(self, ids: Sequence[str]) -> Any:
+        return self._by_owner(ids, lambda c, i: c.get_pids(i))
+
+    def clear_cache(self, ids: list[str]) -> Any:
+        return self._by_owner(ids, lambda c, i: c.clear_cache(i))
+
+    def clear_cache_except_extensions(self, ids: list[str]) -> Any:
+        return self._by_owner(ids, lambda c, i: c.clear_cache_except_extensions(i))
+
+    def delete_browsers_by_ids(self, ids: list[str]) -> Any:
+        result = self._by_owner(ids, lambda c, i: c.delete_browsers_by_ids(i))
+        for browser_id in ids:
+            self.forget(browser_id)
+        return result
+
+    def update_browser_partial(self, ids: Sequence[str], **fields) -> Any:
+        return self._by_owner(ids, lambda c, i: c.update_browser_partial(i, **fields))
+
+    def update_group(self, group_id: str, browser_ids: Sequence[str]) -> Any:
+        return self._by_owner(browser_ids, lambda c, i: c.update_group(group_id, i))
+
+    def update_remark(self, browser_ids: Sequence[str], remark: str) -> Any:
+        return self._by_owner(browser_ids, lambda c, i: c.update_remark(i, remark))
+
+    def update_proxy(self, ids: Sequence[str], *args: Any, **kwargs: Any) -> Any:
+        return self._by_owner(ids, lambda c, i: c.update_proxy(i, *args, **kwargs))
+
+    # --- Fleet-wide calls ---
+    def list_browsers_typed(self, page: int = 0, page_size: int = 100, **filters) -> BrowserListData:
+        """Fetch ``page`` from every healthy instance and merge the results.
+
+        ``totalNum`` is the fleet-wide total; ``list`` holds up to
+        ``page_size`` profiles per instance.
+        """
+        merged = BrowserListData()
+        for c, data in self._fan_out(lambda c: c.list_browsers_typed(page, page_size, **filters)):
+            merged.totalNum += data.totalNum
+            for profile in data.list:
+                if profile.id:
+                    self.learn(profile.id, c)
+                merged.list.append(profile)
+        return merged
+
+    def iter_browsers(self, page_size: int = 100, **filters) -> Iterator[BrowserProfile]:
+        """Yield every profile on every healthy instance, page by page."""
+        page = 0
+        active = self.healthy_clients()
+        while active:
+            results = self._fan_out(
+                lambda c: c.list_browsers_typed(page, page_size, **filters), active
+            )
+            active = []
+            for c, data in results:
+                for profile in data.list:
+                    if profile.id:
+                        self.learn(profile.id, c)
+                    yield profile
+                if data.list and (page + 1) * page_size < data.totalNum:
+                    active.append(c)
+            page += 1
+
+    def get_all_pids(self) -> Any:
+        return _merge([r for _, r in self._fan_out(lambda c: c.get_all_pids())])
+
+    def get_opened_ports(self) -> Any:
+        return _merge([r for _, r in self._fan_out(lambda c: c.get_opened_ports())])
+
+    def close_all(self) -> Any:
+        return _merge([r for _, r in self._fan_out(lambda c: c.close_all())])
+
+
+def _request_id(request: Any, *, required: bool = True) -> str | None:
+    browser_id = request.get("id") if isinstance(request, dict) else getattr(request, "id", None)
+    if required and not browser_id:
+        raise ValueError("request must include a browser 'id'")
+    return browser_id
+
+
+def _merge(results: list[Any]) -> Any:
+    """Combine per-instance results: dicts are merged, lists concatenated."""
+    if not results:
+        return None
+    if all(isinstance(r, dict) for r in results):
+        merged: dict[Any, Any] = {}
+        for r in results:
+            merged.update(r)
+        return merged
+    if all(isinstance(r, list) for r in results):
+        return [item for r in results for item in r]
+    if len(results) == 1:
+        return results[0]
+    return results
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import copy
+import json
+import threading
+from typing import Any, Callable, Hashable, Optional
+
+from bit_browser.clients.timeouts import current_deadline
+from bit_browser.errors import DeadlineExceededError
+
+# Endpoints that only read state, so identical concurrent calls can share
+# one request.
+READ_ONLY_ENDPOINTS = frozenset(
+    {
+        "/browser/detail",
+        "/browser/list",
+        "/browser/ports",
+        "/browser/pids",
+        "/browser/pids/all",
+        "/browser/cookies/get",
+        "/group/list",
+        "/group/detail",
+        "/extralog/list",
+        "/extralog/detail",
+        "/alldisplays",
+    }
+)
+
+
+def request_key(endpoint: str, payload: Optional[dict]) -> str:
+    """Canonical key for ``endpoint`` + ``payload`` (key order ignored)."""
+    body = json.dumps(payload or {}, sort_keys=True, separators=(",", ":"), default=str)
+    return f"{endpoint} {body}"
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Collapse concurrent calls with the same key into one execution.
+
+    The first caller runs ``fn``; callers arriving while it is in flight
+    wait and receive a deep copy of its result, or a copy of its error
+    raised ``from`` the original. Nothing is cached once the call completes.
+
+    :class:`BrowserClient` never coalesces calls made inside a
+    :class:`Deadline`; for direct users, a waiter stops waiting when its own
+    deadline runs out, and if the first caller failed with
+    :class:`DeadlineExceededError` waiters run their own ``fn`` instead.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+        assert call is not None
+
+        if not leader:
+            deadline = current_deadline()
+            if not call.done.wait(deadline.remaining() if deadline is not None else None):
+                raise DeadlineExceededError("deadline exceeded waiting for shared request")
+            if isinstance(call.error, DeadlineExceededError):
+                # The leader's budget, not the request, failed.
+                return fn()
+            if call.error is not None:
+                raise _copy_error(call.error) from call.error
+            return copy.deepcopy(call.result)
+
+        result = None
+        try:
+            result = fn()
+            return result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                waiters = call.waiters
+            try:
+                if waiters and call.error is None:
+                    # Snapshot before anyone is released: the leader's caller
+                    # may mutate ``result`` while waiters are still copying it.
+                    call.result = copy.deepcopy(result)
+            except Exception as e:
+                call.error = e
+            finally:
+                call.done.set()
+
+    @property
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+
+def _copy_error(error: BaseException) -> BaseException:
+    # Each waiter raises its own exception object: re-raising the leader's
+    # one from many threads would keep appending to its shared traceback.
+    cls = type(error)
+    clone = cls.__new__(cls, *error.args)
+    clone.__dict__.update(error.__dict__)
+    return clone
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import contextvars
+import math
+import threading
+import time
+from collections import deque
+from typing import Mapping, Optional
+
+from bit_browser.errors import DeadlineExceededError
+
+DEFAULT_TIMEOUT = 10.0
+
+# Starting (and maximum) timeout per endpoint. Reads that should be instant
+# fail fast when the service is wedged; opens and bulk maintenance get room.
+DEFAULT_PROFILES: dict[str, float] = {
+    "/browser/list": 5.0,
+    "/browser/detail": 5.0,
+    "/browser/ports": 3.0,
+    "/browser/pids": 3.0,
+    "/browser/pids/all": 3.0,
+    "/group/list": 5.0,
+    "/group/detail": 5.0,
+    "/extralog/list": 5.0,
+    "/extralog/detail": 5.0,
+    "/alldisplays": 5.0,
+    "/browser/open": 60.0,
+    "/browser/close/all": 60.0,
+    "/browser/delete/ids": 60.0,
+    "/cache/clear": 120.0,
+    "/cache/clear/exceptExtensions": 120.0,
+}
+
+_current: contextvars.ContextVar[Optional["Deadline"]] = contextvars.ContextVar(
+    "bitbrowser_deadline", default=None
+)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """The innermost active :class:`Deadline` in this context, if any."""
+    return _current.get()
+
+
+class Deadline:
+    """One time budget shared by every request made while it is active.
+
+    Use as a context manager; :class:`BrowserClient` caps each request's
+    timeout to the time left and raises :class:`DeadlineExceededError` once
+    it runs out::
+
+        with Deadline(30):
+            for browser_id in ids:
+                client.browser_close({"id": browser_id})
+
+    Nested deadlines never extend an outer one. The active deadline follows
+    work submitted through :class:`Batch` and the other thread-pool helpers.
+    """
+
+    def __init__(self, seconds: float):
+        self.at = time.monotonic() + seconds
+        self._token: Optional[contextvars.Token] = None
+
+    def remaining(self) -> float:
+        return max(0.0, self.at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.at
+
+    def check(self) -> None:
+        if self.expired:
+            raise DeadlineExceededError("deadline exceeded")
+
+    def cap(self, timeout: Optional[float]) -> float:
+        """Shrink ``timeout`` to the time left; raise if none is left."""
+        self.check()
+        remaining = self.remaining()
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def __enter__(self) -> Deadline:
+        outer = _current.get()
+        if outer is not None and outer.at < self.at:
+            self.at = outer.at
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._token is not None:
+            _current.reset(self._token)
+            self._token = None
+
+
+class TimeoutPolicy:
+    """Per-endpoint request timeouts that adapt to observed latency.
+
+    Each endpoint uses its profile value (``DEFAULT_PROFILES``, else
+    ``default``). With ``adaptive`` set, once ``min_samples`` successful
+    calls are recorded the timeout becomes ``multiplier`` times the
+    ``percentile`` latency over the last ``window`` calls, clamped between
+    ``floor`` and the profile value. A call that times out discards what was
+    learned, so the endpoint goes back to its profile value and relearns.
+    """
+
+    def __init__(
+        self,
+        profiles: Optional[Mapping[str, float]] = None,
+        *,
+        default: float = DEFAULT_TIMEOUT,
+        adaptive: bool = False,
+        percentile: float = 0.99,
+        multiplier: float = 3.0,
+        floor: float = 1.0,
+        window: int = 200,
+        min_samples: int = 20,
+    ):
+        """
+        Args:
+            profiles (Optional[Mapping[str, float]], optional): Endpoint ->
+                timeout overrides, merged over DEFAULT_PROFILES.
+            default (float, optional): Timeout for endpoints without a
+                profile. Defaults to DEFAULT_TIMEOUT.
+            adaptive (bool, optional): Learn from observed latency. Defaults
+                to False.
+            percentile (float, optional): Latency percentile to track.
+                Defaults to 0.99.
+            multiplier (float, optional): Headroom over that percentile.
+                Defaults to 3.0.
+            floor (float, optional): Smallest adaptive timeout. Defaults to 1.0.
+            window (int, optional): Samples kept per endpoint. Defaults to 200.
+            min_samples (int, optional): Samples needed before adapting.
+                Defaults to 20.
+        """
+        self.profiles = {**DEFAULT_PROFILES, **(profiles or {})}
+        self.default = default
+        self.adaptive = adaptive
+        self.percentile = percentile
+        self.multiplier = multiplier
+        self.floor = floor
+        self.window = window
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+        self._samples: dict[str, deque[float]] = {}
+        self._learned: dict[str, float] = {}
+
+    def base(self, endpoint: str) -> float:
+        return self.profiles.get(endpoint, self.default)
+
+    def timeout_for(self, endpoint: str) -> float:
+        base = self.base(endpoint)
+        if not self.adaptive:
+            return base
+        with self._lock:
+            learned = self._learned.get(endpoint)
+            if learned is None:
+                samples = self._samples.get(endpoint)
+                if samples is None or len(samples) < self.min_samples:
+                    return base
+                ordered = sorted(samples)
+                index = min(len(ordered) - 1, math.ceil(self.percentile * len(ordered)) - 1)
+                learned = self._learned[endpoint] = ordered[index] * self.multiplier
+        return min(base, max(self.floor, learned))
+
+    def observe(self, endpoint: str, elapsed: float) -> None:
+        """Record the latency of a successful call."""
+        if not self.adaptive:
+            return
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = deque(maxlen=self.window)
+            samples.append(elapsed)
+            self._learned.pop(endpoint, None)
+
+    def observe_timeout(self, endpoint: str) -> None:
+        """Record that a call timed out at the policy's timeout.
+
+        The learned latency evidently no longer holds: drop it so the
+        endpoint is back at its profile value until ``min_samples`` new
+        successes are observed.
+        """
+        if not self.adaptive:
+            return
+        with self._lock:
+            self._samples.pop(endpoint, None)
+            self._learned.pop(endpoint, None)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+            self._learned.clear()
@@ -1,4 +1,9 @@
+import os
+
 HOST = "127.0.0.1"
 PORT = 54442  # This appears to be the default.
 URL = f"http://{HOST}:{PORT}"
 HEADERS = {"Content-Type": "application/json"}
+
+# Validate fast-path request payloads against their models.
+DEBUG = os.environ.get("BITBROWSER_DEBUG", "").lower() not in ("", "0", "false")
@@ -33,3 +33,6 @@ class ResponseDecodeError(BitBrowserError):
 class ResponseValidationError(BitBrowserError):
     """Response JSON didn't match the expected schema."""
 
+
+class DeadlineExceededError(BitBrowserError, TimeoutError):
+    """An operation ran out of its time budget."""
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from bit_browser.models.base import APIModel
+
+
+class Rect(APIModel):
+    x: int = 0
+    y: int = 0
+    width: int = 0
+    height: int = 0
+
+
+class Display(APIModel):
+    # /alldisplays entry (Electron `screen.getAllDisplays()` shape)
+    id: Optional[int] = None
+    bounds: Optional[Rect] = None
+    workArea: Optional[Rect] = None
+    scaleFactor: Optional[float] = None
+    internal: Optional[bool] = None
+
+    @property
+    def area(self) -> Rect:
+        """Usable area: ``workArea`` when reported, else ``bounds``."""
+        return self.workArea or self.bounds or Rect()
@@ -1,6 +1,8 @@
-from dataclasses import dataclass
+import asyncio
+import time
+from dataclasses import dataclass, replace
 from enum import Enum
-from typing import List, Optional, Set
+from typing import Any, Callable, List, Optional, Set
 
 from bit_browser.clients.browser import BrowserClient
 from bit_browser.models.browser import Browser
@@ -16,6 +18,9 @@ class Session:
     browser_id: str
     status: Status
     browser: Browser
+    pid: Optional[int] = None
+    cookies: Optional[list] = None
+    updated_at: float = 0.0
 
 
 class BrowserManager:
@@ -60,3 +65,182 @@ class BrowserManager:
         if r:
             pass  # TODO - implement
         return None
+
+
+class AsyncBrowserManager:
+    """Asyncio counterpart of :class:`BrowserManager` that keeps itself current.
+
+    Background tasks refresh the inventory (``/browser/list``, including
+    proxy settings), poll open/closed status (``/browser/pids/all``) and,
+    optionally, cookies of open profiles. Network calls run in worker
+    threads; the read methods only look at in-memory state and never wait
+    on the network.
+
+    ``Session`` objects are replaced rather than mutated, so a snapshot stays
+    consistent while syncing continues::
+
+        async with AsyncBrowserManager(client) as manager:
+            await manager.wait_ready()
+            open_now = await manager.query(status=Status.open)
+    """
+
+    def __init__(
+        self,
+        client: BrowserClient,
+        *,
+        inventory_interval: float = 60.0,
+        status_interval: float = 2.0,
+        cookie_interval: Optional[float] = None,
+        page_size: int = 100,
+    ):
+        """
+        Args:
+            client (BrowserClient): Client used for syncing.
+            inventory_interval (float, optional): Seconds between inventory
+                refreshes. Defaults to 60.0.
+            status_interval (float, optional): Seconds between status polls.
+                Defaults to 2.0.
+            cookie_interval (Optional[float], optional): Seconds between
+                cookie refreshes of open profiles; None disables it.
+                Defaults to None.
+            page_size (int, optional): Page size for ``/browser/list``.
+                Defaults to 100.
+        """
+        self.client = client
+        self.inventory_interval = inventory_interval
+        self.status_interval = status_interval
+        self.cookie_interval = cookie_interval
+        self.page_size = page_size
+        self.sessions: dict[str, Session] = {}
+        self.last_error: Optional[BaseException] = None
+        self._ready = asyncio.Event()
+        self._wake_inventory = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+
+    async def __aenter__(self) -> "AsyncBrowserManager":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.stop()
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        self._tasks = [asyncio.create_task(self._inventory_loop())]
+        self._tasks.append(asyncio.create_task(self._every(self.status_interval, self._sync_status)))
+        if self.cookie_interval is not None:
+            self._tasks.append(asyncio.create_task(self._every(self.cookie_interval, self._sync_cookies)))
+
+    async def stop(self) -> None:
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    # --- Reads (no network) ---
+    async def wait_ready(self, timeout: Optional[float] = None) -> None:
+        """Wait for the first inventory refresh to complete."""
+        await asyncio.wait_for(self._ready.wait(), timeout)
+
+    async def snapshot(self) -> dict[str, Session]:
+        return dict(self.sessions)
+
+    async def get(self, browser_id: str) -> Optional[Session]:
+        return self.sessions.get(browser_id)
+
+    async def query(
+        self,
+        *,
+        status: Optional[Status] = None,
+        group_id: Optional[str] = None,
+        predicate: Optional[Callable[[Session], bool]] = None,
+    ) -> List[Session]:
+        return [
+            s
+            for s in list(self.sessions.values())
+            if (status is None or s.status is status)
+            and (group_id is None or s.browser.groupId == group_id)
+            and (predicate is None or predicate(s))
+        ]
+
+    def refresh_soon(self) -> None:
+        """Ask the inventory loop to refresh now instead of at its next tick."""
+        self._wake_inventory.set()
+
+    # --- Sync ---
+    async def _every(self, interval: float, step: Callable[[], Any]) -> None:
+        await self._ready.wait()
+        while True:
+            try:
+                await step()
+            except Exception as e:  # keep syncing; surface via last_error
+                self.last_error = e
+            await asyncio.sleep(interval)
+
+    async def _inventory_loop(self) -> None:
+        while True:
+            try:
+                await self._sync_inventory()
+                self._ready.set()
+            except Exception as e:
+                self.last_error = e
+            self._wake_inventory.clear()
+            try:
+                await asyncio.wait_for(self._wake_inventory.wait(), self.inventory_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _sync_inventory(self) -> None:
+        profiles: list[Browser] = []
+        page = 0
+        while True:
+            data = await asyncio.to_thread(
+                self.client.list_browsers_typed, page=page, page_size=self.page_size
+            )
+            profiles.extend(data.list)
+            if not data.list or len(profiles) >= data.totalNum:
+                break
+            page += 1
+
+        now = time.monotonic()
+        sessions: dict[str, Session] = {}
+        for b in profiles:
+            if b.id is None:
+                continue
+            current = self.sessions.get(b.id)
+            if current is None:
+                sessions[b.id] = Session(browser_id=b.id, status=Status.closed, browser=b, updated_at=now)
+            else:
+                sessions[b.id] = replace(current, browser=b, updated_at=now)
+        self.sessions = sessions
+
+    async def _sync_status(self) -> None:
+        pids = await asyncio.to_thread(self.client.get_all_pids) or {}
+        now = time.monotonic()
+        sessions = dict(self.sessions)
+        for browser_id, session in sessions.items():
+            is_open = browser_id in pids
+            status = Status.open if is_open else Status.closed
+            pid = pids.get(browser_id) if is_open else None
+            if session.status is not status or session.pid != pid:
+                sessions[browser_id] = replace(session, status=status, pid=pid, updated_at=now)
+        if any(browser_id not in sessions for browser_id in pids):
+            self.refresh_soon()  # opened profile we haven't listed yet
+        self.sessions = sessions
+
+    async def _sync_cookies(self) -> None:
+        fetched: dict[str, Any] = {}
+        for session in [s for s in self.sessions.values() if s.status is Status.open]:
+            try:
+                fetched[session.browser_id] = await asyncio.to_thread(
+                    self.client.cookies_get, session.browser_id
+                )
+            except Exception as e:  # closed meanwhile, etc.; try again next tick
+                self.last_error = e
+        now = time.monotonic()
+        sessions = dict(self.sessions)
+        for browser_id, cookies in fetched.items():
+            if browser_id in sessions:
+                sessions[browser_id] = replace(sessions[browser_id], cookies=cookies, updated_at=now)
+        self.sessions = sessions
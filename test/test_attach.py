@@ -0,0 +1,111 @@
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from bit_browser.clients import open_and_attach
+from bit_browser.clients.browser import BrowserClient
+from bit_browser.errors import DeadlineExceededError
+
+
+class DevToolsStub:
+    """Serves ``/browser/open`` and a ``/json/version`` that turns ready late.
+
+    ``ready_after`` maps a browser id to the seconds between its open and
+    its DevTools endpoint answering 200; ids missing from it never answer.
+    """
+
+    def __init__(self, ready_after):
+        self.ready_after = ready_after
+        self.ready_at = {}
+        self.probes = {}
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):  # noqa: N802
+                length = int(self.headers.get("Content-Length") or 0)
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                browser_id = payload["id"]
+                with stub._lock:
+                    delay = stub.ready_after.get(browser_id)
+                    stub.ready_at[browser_id] = (
+                        time.monotonic() + delay if delay is not None else None
+                    )
+                port = stub.server.server_address[1]
+                data = {
+                    "ws": f"ws://127.0.0.1:{port}/devtools/browser/{browser_id}",
+                    "http": f"127.0.0.1:{port}/p/{browser_id}",
+                }
+                self._reply(200, {"success": True, "data": data})
+
+            def do_GET(self):  # noqa: N802
+                browser_id = self.path.split("/")[2]
+                with stub._lock:
+                    stub.probes[browser_id] = stub.probes.get(browser_id, 0) + 1
+                    ready_at = stub.ready_at.get(browser_id)
+                if ready_at is None or time.monotonic() < ready_at:
+                    self._reply(503, {})
+                else:
+                    self._reply(200, {"webSocketDebuggerUrl": f"ws://ready/{browser_id}"})
+
+            def _reply(self, status, body):
+                raw = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(raw)))
+                self.end_headers()
+                self.wfile.write(raw)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class TestOpenAndAttach(unittest.TestCase):
+    def attach(self, ready_after, ids, **options):
+        with DevToolsStub(ready_after) as stub:
+            client = BrowserClient(url=stub.url)
+            results = list(open_and_attach(client, ids, max_workers=len(ids), **options))
+        return stub, results
+
+    def test_yields_in_completion_order(self):
+        _, results = self.attach({"slow": 0.6, "fast": 0.0, "mid": 0.25}, ["slow", "fast", "mid"])
+        self.assertEqual([r.browser_id for r in results], ["fast", "mid", "slow"])
+        self.assertTrue(all(r.ready for r in results))
+        self.assertEqual(results[0].ws, "ws://ready/fast")
+
+    def test_backs_off_until_ready(self):
+        stub, results = self.attach({"a": 0.4}, ["a"], initial_delay=0.05, max_delay=1.0)
+        (result,) = results
+        self.assertTrue(result.ready)
+        self.assertGreaterEqual(result.elapsed, 0.4)
+        # 0.05 + 0.1 + 0.2 + 0.4 covers 0.4 s: a handful of probes, not a busy loop.
+        self.assertGreater(stub.probes["a"], 1)
+        self.assertLessEqual(stub.probes["a"], 6)
+
+    def test_deadline_is_per_profile(self):
+        _, results = self.attach({"ok": 0.0}, ["never", "ok"], deadline=0.5)
+        by_id = {r.browser_id: r for r in results}
+        self.assertTrue(by_id["ok"].ready)
+        self.assertFalse(by_id["never"].ready)
+        self.assertIsInstance(by_id["never"].error, DeadlineExceededError)
+        self.assertLess(by_id["never"].elapsed, 2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
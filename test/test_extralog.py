@@ -0,0 +1,137 @@
+import gc
+import threading
+import time
+import unittest
+import weakref
+from unittest import mock
+
+from bit_browser.clients import ExtralogStore
+from bit_browser.clients.browser import BrowserClient
+from bit_browser.errors import APIError, BitBrowserError
+from bit_browser.models.extralog import ExtralogItem
+
+
+class FakeService:
+    """Records extralog writes in order; ``fail_on`` keys raise APIError."""
+
+    def __init__(self, latency=0.0, echo_key=True):
+        self.latency = latency
+        self.echo_key = echo_key
+        self.fail_on = set()
+        self.writes = []
+        self._ids = iter(range(1, 10_000))
+        self.client = mock.Mock(spec=BrowserClient)
+        self.client.extralog_add_typed.side_effect = self.add
+        self.client.extralog_update.side_effect = self.update
+
+    def add(self, **data):
+        time.sleep(self.latency)
+        if data["log_key"] in self.fail_on:
+            raise APIError(f"rejected {data['log_key']}")
+        self.writes.append(("add", data["log_key"]))
+        if self.echo_key:
+            return ExtralogItem(id=next(self._ids), **data)
+        return ExtralogItem(id=next(self._ids))
+
+    def update(self, log_id, **fields):
+        time.sleep(self.latency)
+        self.writes.append(("update", log_id))
+        return {}
+
+
+class TestExtralogStore(unittest.TestCase):
+    def setUp(self):
+        self.service = FakeService()
+
+    def store(self):
+        return ExtralogStore(self.service.client)
+
+    def test_writes_are_sent_in_order(self):
+        store = self.store()
+        for i in range(5):
+            store.add(f"k{i}", "n", "v", "t")
+        store.update(42, log_value="x")
+        store.flush()
+        self.assertEqual(
+            self.service.writes, [("add", f"k{i}") for i in range(5)] + [("update", 42)]
+        )
+        self.assertEqual(store.pending, 0)
+        store.close()
+
+    def test_add_returns_before_write_is_sent(self):
+        self.service.latency = 0.2
+        store = self.store()
+        start = time.monotonic()
+        item = store.add("k", "n", "v", "t")
+        self.assertLess(time.monotonic() - start, 0.1)
+        self.assertIsNone(item.id)
+        self.assertIs(store.get_by_key("k"), item)
+        store.close()
+
+    def test_saved_item_replaces_pending_one(self):
+        store = self.store()
+        pending = store.add("k", "n", "v", "jobs")
+        store.flush()
+        saved = store.get_by_key("k")
+        self.assertIsNot(saved, pending)
+        self.assertEqual(saved.id, 1)
+        self.assertIs(store.get(1), saved)
+        self.assertEqual(store.find(log_type="jobs"), [saved])
+        store.close()
+
+    def test_id_only_echo_fills_pending_item(self):
+        self.service.echo_key = False
+        store = self.store()
+        pending = store.add("k", "n", "v", "t")
+        store.flush()
+        self.assertIs(store.get_by_key("k"), pending)
+        self.assertEqual(pending.id, 1)
+        store.close()
+
+    def test_flush_raises_write_error_and_keeps_going(self):
+        self.service.fail_on = {"bad"}
+        store = self.store()
+        store.add("bad", "n", "v", "t")
+        store.add("good", "n", "v", "t")
+        with self.assertRaises(APIError):
+            store.flush()
+        self.assertEqual(self.service.writes, [("add", "good")])
+        store.flush()  # the error was reported once
+        store.close()
+
+    def test_close_raises_write_error_and_rejects_writes(self):
+        self.service.fail_on = {"bad"}
+        store = self.store()
+        store.add("bad", "n", "v", "t")
+        with self.assertRaises(APIError):
+            store.close()
+        store.close()  # idempotent
+        with self.assertRaises(BitBrowserError):
+            store.add("k", "n", "v", "t")
+
+    def test_unclosed_store_is_flushed_on_garbage_collection(self):
+        self.service.latency = 0.05
+        store = ExtralogStore(self.service.client)
+        for i in range(3):
+            store.add(f"k{i}", "n", "v", "t")
+        ref = weakref.ref(store)
+        del store
+        gc.collect()
+        self.assertIsNone(ref())
+        self.assertEqual(self.service.writes, [("add", f"k{i}") for i in range(3)])
+        self.assertFalse(
+            any(t.name == "bitbrowser-extralog" for t in threading.enumerate())
+        )
+
+    def test_finalizer_logs_instead_of_raising(self):
+        self.service.fail_on = {"bad"}
+        store = ExtralogStore(self.service.client)
+        store.add("bad", "n", "v", "t")
+        with self.assertLogs("bit_browser.clients.extralog", level="ERROR") as logs:
+            del store
+            gc.collect()
+        self.assertIn("rejected bad", "\n".join(logs.output))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+import socket
+import threading
+import time
+import unittest
+from unittest import mock
+
+import requests
+
+from bit_browser.clients.browser import PING_ENDPOINT, BrowserClient
+from bit_browser.clients.timeouts import TimeoutPolicy
+from bit_browser.errors import NetworkError
+
+
+class WedgedServer:
+    """Accepts connections and reads requests but never answers."""
+
+    def __init__(self):
+        self.sock = socket.socket()
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.listen(128)
+        self.url = f"http://127.0.0.1:{self.sock.getsockname()[1]}"
+        self.received = []
+        self._conns = []
+        self._stop = False
+
+    def _serve(self):
+        while not self._stop:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return
+            self._conns.append(conn)
+            threading.Thread(target=self._read, args=(conn,), daemon=True).start()
+
+    def _read(self, conn):
+        try:
+            while data := conn.recv(65536):
+                self.received.append(data)
+        except OSError:
+            pass
+
+    def __enter__(self):
+        threading.Thread(target=self._serve, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop = True
+        self.sock.close()
+        for conn in self._conns:
+            conn.close()
+
+
+def ok_response():
+    response = mock.Mock(ok=True, status_code=200)
+    response.json.return_value = {"success": True, "data": {}}
+    return response
+
+
+class TestHealth(unittest.TestCase):
+    def setUp(self):
+        self.urls = []
+        self.lock = threading.Lock()
+        self.fail_with = None
+        self.ping_error = None
+
+    def client(self, **options):
+        client = BrowserClient(**options)
+        client.session = mock.Mock(post=self.post)
+        return client
+
+    def post(self, url, json=None, timeout=None):
+        with self.lock:
+            self.urls.append(url)
+        if url.endswith(PING_ENDPOINT) and self.ping_error is not None:
+            time.sleep(0.2)
+            raise self.ping_error
+        if self.fail_with is not None:
+            raise self.fail_with
+        return ok_response()
+
+    def pings(self):
+        return sum(url.endswith(PING_ENDPOINT) for url in self.urls)
+
+    def test_wedged_service_calls_run_in_parallel_without_pings(self):
+        with WedgedServer() as server:
+            client = BrowserClient(
+                url=server.url, timeout_policy=TimeoutPolicy({"/browser/detail": 0.3})
+            )
+            errors = []
+
+            def call(i):
+                try:
+                    client.get_browser_details(f"id-{i}")
+                except NetworkError as e:
+                    errors.append(e)
+
+            threads = [threading.Thread(target=call, args=(i,)) for i in range(8)]
+            start = time.monotonic()
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            elapsed = time.monotonic() - start
+        self.assertEqual(len(errors), 8)
+        self.assertLess(elapsed, 1.5)
+        self.assertNotIn(PING_ENDPOINT.encode(), b"".join(server.received))
+
+    def test_healthy_idle_client_never_pings(self):
+        client = self.client(health_ttl=0.05)
+        client.get_browser_details("a")
+        time.sleep(0.1)
+        client.get_browser_details("b")
+        self.assertEqual(len(self.urls), 2)
+        self.assertEqual(self.pings(), 0)
+
+    def test_fails_fast_after_connection_failure(self):
+        client = self.client(health_ttl=5.0)
+        self.fail_with = requests.ConnectionError("refused")
+        with self.assertRaises(NetworkError):
+            client.get_browser_details("a")
+        with self.assertRaises(NetworkError):
+            client.get_browser_details("b")
+        self.assertEqual(len(self.urls), 1)
+        self.assertIs(client.cached_health(), False)
+
+    def test_one_ping_after_failure_expires(self):
+        client = self.client(health_ttl=0.05)
+        self.fail_with = requests.ConnectionError("refused")
+        with self.assertRaises(NetworkError):
+            client.get_browser_details("a")
+        self.fail_with = None
+        time.sleep(0.1)
+        threads = [
+            threading.Thread(target=client.get_browser_details, args=(f"id-{i}",))
+            for i in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(self.pings(), 1)
+        self.assertEqual(len(self.urls), 1 + 1 + 8)
+        self.assertIs(client.cached_health(), True)
+
+    def test_inconclusive_ping_is_not_repeated(self):
+        client = self.client(health_ttl=1.0)
+        self.fail_with = requests.ConnectionError("refused")
+        with self.assertRaises(NetworkError):
+            client.get_browser_details("a")
+        self.fail_with = None
+        client._health = (False, time.monotonic() - 2)  # failure has expired
+        self.ping_error = requests.ReadTimeout("wedged")
+        threads = [
+            threading.Thread(target=client.get_browser_details, args=(f"id-{i}",))
+            for i in range(4)
+        ]
+        start = time.monotonic()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(self.pings(), 1)
+        self.assertLess(time.monotonic() - start, 0.35)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+from bit_browser.clients import RpaScheduler
+from bit_browser.clients.browser import BrowserClient
+from bit_browser.clients.rpa import TaskState
+from bit_browser.errors import APIError
+
+
+class TestRpaScheduler(unittest.TestCase):
+    def setUp(self):
+        self.started = []
+        self.client = mock.Mock(spec=BrowserClient)
+        self.client.rpa_run.side_effect = lambda task_id: self.started.append(task_id)
+
+    def scheduler(self, **options):
+        options.setdefault("poll_interval", 0.01)
+        scheduler = RpaScheduler(self.client, **options)
+        self.addCleanup(scheduler.stop)
+        return scheduler
+
+    def test_successful_run_is_done_without_callback(self):
+        scheduler = self.scheduler(max_running=2)
+        for i in range(5):
+            scheduler.submit(f"t{i}")
+        scheduler.start()
+        self.assertTrue(scheduler.join(timeout=2))
+        metrics = scheduler.metrics()
+        self.assertEqual((metrics.done, metrics.stopped), (5, 0))
+        self.client.rpa_stop.assert_not_called()
+
+    def test_priority_order_then_fifo(self):
+        scheduler = self.scheduler(max_running=1)
+        scheduler.submit("low", priority=0)
+        scheduler.submit("high-1", priority=5)
+        scheduler.submit("mid", priority=1)
+        scheduler.submit("high-2", priority=5)
+        scheduler.start()
+        self.assertTrue(scheduler.join(timeout=2))
+        self.assertEqual(self.started, ["high-1", "high-2", "mid", "low"])
+
+    def test_concurrency_limit(self):
+        finished = set()
+        scheduler = self.scheduler(max_running=2, is_done=lambda task_id: task_id in finished)
+        for i in range(5):
+            scheduler.submit(f"t{i}")
+        scheduler.start()
+        time.sleep(0.1)
+        self.assertEqual(self.started, ["t0", "t1"])
+        self.assertEqual(scheduler.metrics().running, 2)
+
+        finished.add("t0")
+        time.sleep(0.1)
+        self.assertEqual(self.started, ["t0", "t1", "t2"])
+        self.assertEqual(scheduler.metrics().running, 2)
+
+        scheduler.mark_done("t1")
+        finished.update({"t2", "t3", "t4"})
+        self.assertTrue(scheduler.join(timeout=2))
+        self.assertEqual(scheduler.metrics().done, 5)
+
+    def test_timeout_stops_task(self):
+        scheduler = self.scheduler(max_running=1, timeout=0.05, is_done=lambda task_id: False)
+        scheduler.submit("slow")
+        scheduler.submit("next")
+        scheduler.start()
+        self.assertTrue(scheduler.join(timeout=2))
+        self.assertEqual(self.client.rpa_stop.call_args_list, [mock.call("slow"), mock.call("next")])
+        self.assertEqual(scheduler.status("slow"), TaskState.stopped)
+        self.assertEqual(scheduler.metrics().stopped, 2)
+
+    def test_cancel_queued_task(self):
+        release = threading.Event()
+        scheduler = self.scheduler(max_running=1, is_done=lambda task_id: release.is_set())
+        scheduler.submit("first")
+        scheduler.submit("second")
+        scheduler.start()
+        time.sleep(0.05)
+        self.assertFalse(scheduler.cancel("first"))  # already running
+        self.assertTrue(scheduler.cancel("second"))
+        release.set()
+        self.assertTrue(scheduler.join(timeout=2))
+        self.assertEqual(self.started, ["first"])
+        self.assertEqual(scheduler.status("second"), TaskState.cancelled)
+
+    def test_failed_start_frees_slot(self):
+        def rpa_run(task_id):
+            if task_id == "bad":
+                raise APIError("no such task")
+            self.started.append(task_id)
+
+        self.client.rpa_run.side_effect = rpa_run
+        scheduler = self.scheduler(max_running=1)
+        scheduler.submit("bad")
+        scheduler.submit("good")
+        scheduler.start()
+        self.assertTrue(scheduler.join(timeout=2))
+        self.assertEqual(scheduler.status("bad"), TaskState.failed)
+        self.assertIsInstance(scheduler.tasks["bad"].error, APIError)
+        self.assertEqual(scheduler.status("good"), TaskState.done)
+
+
+if __name__ == "__main__":
+    unittest.main()
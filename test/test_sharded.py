@@ -0,0 +1,69 @@
+import time
+import unittest
+from unittest import mock
+
+from bit_browser.clients import ShardedClient
+from bit_browser.clients.browser import BrowserClient
+from bit_browser.errors import APIError
+from bit_browser.models.browser import BrowserListData, BrowserProfile
+
+
+def host(ids, latency=0.01):
+    """A mock BrowserClient owning ``ids``."""
+    client = mock.Mock(spec=BrowserClient)
+    client.cached_health.return_value = None
+
+    def list_browsers_typed(page=0, page_size=100, **filters):
+        time.sleep(latency)
+        rows = ids[page * page_size : (page + 1) * page_size]
+        return BrowserListData(list=[BrowserProfile(id=i) for i in rows], totalNum=len(ids))
+
+    def browser_detail(request):
+        time.sleep(latency)
+        if request["id"] not in ids:
+            raise APIError("not found")
+        return {"id": request["id"]}
+
+    client.list_browsers_typed.side_effect = list_browsers_typed
+    client.browser_detail.side_effect = browser_detail
+    client.get_pids.side_effect = lambda i: {browser_id: 1 for browser_id in i}
+    return client
+
+
+class TestShardedOwnership(unittest.TestCase):
+    def setUp(self):
+        self.a = host([f"a{i}" for i in range(150)])
+        self.b = host([f"b{i}" for i in range(150)])
+        self.sharded = ShardedClient([self.a, self.b])
+        self.addCleanup(self.sharded.close)
+
+    def test_bulk_call_resolves_unknown_ids_in_one_sweep(self):
+        ids = [f"a{i}" for i in range(100)] + [f"b{i}" for i in range(100)]
+        start = time.monotonic()
+        pids = self.sharded.get_pids(ids)
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(set(pids), set(ids))
+        self.assertEqual(self.a.get_pids.call_args.args[0], ids[:100])
+        self.assertEqual(self.b.get_pids.call_args.args[0], ids[100:])
+        self.a.browser_detail.assert_not_called()
+        self.assertLessEqual(self.a.list_browsers_typed.call_count, 2)
+        self.assertLessEqual(self.b.list_browsers_typed.call_count, 2)
+
+    def test_single_unknown_id_is_probed(self):
+        self.assertIs(self.sharded.owner("b7"), self.b)
+        self.a.list_browsers_typed.assert_not_called()
+
+    def test_known_ids_need_no_requests(self):
+        self.sharded.learn("a1", self.a)
+        self.sharded.learn("b1", self.b)
+        self.sharded.get_pids(["a1", "b1"])
+        self.a.list_browsers_typed.assert_not_called()
+        self.a.browser_detail.assert_not_called()
+
+    def test_unknown_ids_raise(self):
+        with self.assertRaises(APIError):
+            self.sharded.get_pids(["a1", "zz", "yy"])
+
+
+if __name__ == "__main__":
+    unittest.main()
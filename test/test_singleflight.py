@@ -0,0 +1,177 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+import requests
+
+from bit_browser.clients.browser import BrowserClient
+from bit_browser.clients.singleflight import SingleFlight
+from bit_browser.clients.timeouts import Deadline
+from bit_browser.errors import APIError, DeadlineExceededError, HTTPStatusError
+
+
+def run_together(n, target):
+    """Start ``n`` threads on ``target`` (staggered by 10 ms); return outcomes."""
+    outcomes = [None] * n
+
+    def run(i):
+        try:
+            outcomes[i] = target()
+        except BaseException as e:
+            outcomes[i] = e
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+        time.sleep(0.01)
+    for t in threads:
+        t.join()
+    return outcomes
+
+
+class TestSingleFlight(unittest.TestCase):
+    def setUp(self):
+        self.flight = SingleFlight()
+        self.calls = 0
+
+    def slow(self, result=None, error=None):
+        def fn():
+            self.calls += 1
+            time.sleep(0.2)
+            if error is not None:
+                raise error
+            return result
+
+        return fn
+
+    def test_shares_result(self):
+        outcomes = run_together(5, lambda: self.flight.do("k", self.slow({"list": [1]})))
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(all(o == {"list": [1]} for o in outcomes))
+        # Waiters get copies, not the leader's object.
+        self.assertEqual(len({id(o) for o in outcomes}), 5)
+        self.assertEqual(self.flight.in_flight, 0)
+
+    def test_leader_mutation_does_not_reach_waiters(self):
+        def leader_caller():
+            result = self.flight.do("k", self.slow({"list": list(range(1000))}))
+            result["list"].clear()
+            result["mutated"] = True
+            return result
+
+        def waiter():
+            return self.flight.do("k", self.slow({"unused": True}))
+
+        outcomes = [None] * 5
+
+        def run(i, target):
+            outcomes[i] = target()
+
+        threads = [threading.Thread(target=run, args=(0, leader_caller))]
+        threads += [threading.Thread(target=run, args=(i, waiter)) for i in range(1, 5)]
+        threads[0].start()
+        time.sleep(0.05)
+        for t in threads[1:]:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(outcomes[0]["mutated"])
+        for result in outcomes[1:]:
+            self.assertEqual(result, {"list": list(range(1000))})
+
+    def test_shares_error_as_copies(self):
+        leader_error = HTTPStatusError(500, "boom")
+        outcomes = run_together(4, lambda: self.flight.do("k", self.slow(error=leader_error)))
+        self.assertEqual(self.calls, 1)
+        self.assertIs(outcomes[0], leader_error)
+        for error in outcomes[1:]:
+            self.assertIsInstance(error, HTTPStatusError)
+            self.assertIsNot(error, leader_error)
+            self.assertIs(error.__cause__, leader_error)
+            self.assertEqual(error.status_code, 500)
+            self.assertEqual(error.body, "boom")
+
+    def test_api_error_keeps_data(self):
+        leader_error = APIError("not found", data={"id": "x"})
+        outcomes = run_together(2, lambda: self.flight.do("k", self.slow(error=leader_error)))
+        self.assertIsInstance(outcomes[1], APIError)
+        self.assertEqual(outcomes[1].data, {"id": "x"})
+        self.assertEqual(str(outcomes[1]), "not found")
+
+    def test_leader_deadline_not_shared(self):
+        def waiter():
+            return self.flight.do("k", lambda: "own result")
+
+        leader = threading.Thread(
+            target=lambda: self.assertRaises(
+                DeadlineExceededError,
+                self.flight.do,
+                "k",
+                self.slow(error=DeadlineExceededError("leader budget")),
+            )
+        )
+        leader.start()
+        time.sleep(0.05)
+        self.assertEqual(waiter(), "own result")
+        leader.join()
+
+
+class TestClientCoalescing(unittest.TestCase):
+    def setUp(self):
+        self.client = BrowserClient()
+        self.posts = 0
+        self.lock = threading.Lock()
+        self.client.session = mock.Mock(post=self.post)
+
+    def post(self, url, json=None, timeout=None):
+        with self.lock:
+            self.posts += 1
+        if timeout is not None and timeout < 0.3:
+            time.sleep(timeout)
+            raise requests.ReadTimeout("read timed out")
+        time.sleep(0.3)
+        response = mock.Mock(ok=True, status_code=200)
+        response.json.return_value = {"success": True, "data": {"list": [], "totalNum": 0}}
+        return response
+
+    def list_browsers(self):
+        return self.client._post("/browser/list", {"page": 0, "pageSize": 10})
+
+    def test_identical_reads_share_one_request(self):
+        outcomes = run_together(8, self.list_browsers)
+        self.assertEqual(self.posts, 1)
+        self.assertTrue(all(o == {"list": [], "totalNum": 0} for o in outcomes))
+
+    def test_deadline_of_one_caller_does_not_fail_another(self):
+        def bounded():
+            with Deadline(0.2):
+                return self.list_browsers()
+
+        results = {}
+        a = threading.Thread(target=lambda: results.setdefault("a", _outcome(bounded)))
+        a.start()
+        time.sleep(0.05)
+        results["b"] = _outcome(self.list_browsers)
+        a.join()
+        self.assertIsInstance(results["a"], DeadlineExceededError)
+        self.assertEqual(results["b"], {"list": [], "totalNum": 0})
+
+    def test_explicit_timeout_is_not_shared(self):
+        outcomes = run_together(
+            2, lambda: self.client._post("/browser/list", {"page": 0}, timeout=5.0)
+        )
+        self.assertEqual(self.posts, 2)
+        self.assertEqual(outcomes[0], outcomes[1])
+
+
+def _outcome(fn):
+    try:
+        return fn()
+    except BaseException as e:
+        return e
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import time
+import unittest
+from unittest import mock
+
+import requests
+
+from bit_browser.clients.browser import BrowserClient
+from bit_browser.clients.timeouts import Deadline, TimeoutPolicy
+from bit_browser.errors import DeadlineExceededError, NetworkError
+
+
+def ok_response():
+    response = mock.Mock(ok=True, status_code=200)
+    response.json.return_value = {"success": True, "data": {}}
+    return response
+
+
+class TestTimeoutPolicy(unittest.TestCase):
+    def test_static_by_default(self):
+        policy = TimeoutPolicy()
+        for _ in range(50):
+            policy.observe("/browser/open", 2.0)
+        self.assertEqual(policy.timeout_for("/browser/open"), 60.0)
+        self.assertEqual(policy.timeout_for("/browser/unknown"), 10.0)
+
+    def test_learns_from_latency(self):
+        policy = TimeoutPolicy(adaptive=True, min_samples=20)
+        for _ in range(19):
+            policy.observe("/browser/open", 2.0)
+        self.assertEqual(policy.timeout_for("/browser/open"), 60.0)
+        policy.observe("/browser/open", 2.0)
+        self.assertEqual(policy.timeout_for("/browser/open"), 6.0)
+
+    def test_clamped_to_floor_and_profile(self):
+        policy = TimeoutPolicy(adaptive=True, min_samples=1, floor=1.0)
+        policy.observe("/browser/update", 0.01)
+        self.assertEqual(policy.timeout_for("/browser/update"), 1.0)
+        policy.observe("/browser/list", 30.0)
+        self.assertEqual(policy.timeout_for("/browser/list"), 5.0)
+
+    def test_timeout_resets_to_profile(self):
+        policy = TimeoutPolicy(adaptive=True, min_samples=20)
+        for _ in range(20):
+            policy.observe("/browser/open", 2.0)
+        policy.observe_timeout("/browser/open")
+        self.assertEqual(policy.timeout_for("/browser/open"), 60.0)
+
+
+class TestClientTimeouts(unittest.TestCase):
+    def setUp(self):
+        self.client = BrowserClient(timeout_policy=TimeoutPolicy(adaptive=True, min_samples=20))
+        self.post = mock.Mock(return_value=ok_response())
+        self.client.session = mock.Mock(post=self.post)
+
+    def sent_timeout(self):
+        return self.post.call_args.kwargs["timeout"]
+
+    def test_recovers_after_timeout(self):
+        for _ in range(20):
+            self.client.timeout_policy.observe("/browser/open", 2.0)
+        self.client._post("/browser/open", {"id": "a"})
+        self.assertEqual(self.sent_timeout(), 6.0)
+
+        self.post.side_effect = requests.ReadTimeout("slow cold open")
+        with self.assertRaises(NetworkError):
+            self.client._post("/browser/open", {"id": "a"})
+
+        self.post.side_effect = None
+        self.client._post("/browser/open", {"id": "a"})
+        self.assertEqual(self.sent_timeout(), 60.0)
+
+    def test_explicit_timeout_does_not_reset_policy(self):
+        for _ in range(20):
+            self.client.timeout_policy.observe("/browser/open", 2.0)
+        self.post.side_effect = requests.ReadTimeout("caller's own limit")
+        with self.assertRaises(NetworkError):
+            self.client._post("/browser/open", {"id": "a"}, timeout=0.1)
+        self.assertEqual(self.client.timeout_policy.timeout_for("/browser/open"), 6.0)
+
+    def test_deadline_caps_timeout(self):
+        with Deadline(0.5):
+            self.client._post("/browser/open", {"id": "a"})
+        self.assertLessEqual(self.sent_timeout(), 0.5)
+        self.assertGreater(self.sent_timeout(), 0.0)
+
+    def test_nested_deadline_never_extends_outer(self):
+        with Deadline(0.5):
+            with Deadline(30) as inner:
+                self.assertLessEqual(inner.remaining(), 0.5)
+
+    def test_expired_deadline_raises_without_request(self):
+        with Deadline(0.01):
+            time.sleep(0.02)
+            with self.assertRaises(DeadlineExceededError):
+                self.client._post("/browser/open", {"id": "a"})
+        self.post.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()